@@ -23,9 +23,42 @@ class Settings(BaseSettings):
     GROQ_API_KEY: Optional[str] = None
     LLM_MODEL: str = "llama-3.1-70b-versatile"
     
+    # OpenAI API (optional LLM fallback / Whisper transcription)
+    OPENAI_API_KEY: Optional[str] = None
+    
+    # LLM call tuning
+    LLM_CALL_TIMEOUT: float = 120.0  # seconds per LLM request
+    LLM_MAX_CONCURRENCY: int = 4  # parallel LLM requests across the process
+    LLM_COMBINED_MODE: bool = False  # one completion for summary + tasks
+    LLM_CHUNK_CHARS: int = 12000  # longer transcripts are processed map-reduce style
+    LLM_CHUNK_OVERLAP: int = 800  # characters repeated between consecutive chunks
+    
+    # LLM result cache
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_DIR: str = "./cache/llm"
+    LLM_CACHE_MEMORY_ENTRIES: int = 256
+    LLM_CACHE_MAX_BYTES: int = 50 * 1024 * 1024  # 50MB on disk
+    
     # AssemblyAI (for Transcription)
     ASSEMBLYAI_API_KEY: Optional[str] = None
     
+    # Audio pre-processing (needs ffmpeg + numpy)
+    AUDIO_PREPROCESSING_ENABLED: bool = True
+    AUDIO_SAMPLE_RATE: int = 16000
+    AUDIO_MAX_SILENCE: float = 1.0  # longer pauses are shortened to this many seconds
+    AUDIO_BITRATE: str = "24k"
+    
+    # Segmented transcription: long audio is split at quiet points and transcribed in parallel
+    SEGMENTED_TRANSCRIPTION: bool = False
+    TRANSCRIPTION_SEGMENT_SECONDS: float = 600.0
+    TRANSCRIPTION_CONCURRENCY: int = 4
+    
+    # Live transcription over /ws/live: seconds of new audio per rolling window
+    LIVE_WINDOW_SECONDS: float = 30.0
+    LIVE_RESUME_TIMEOUT: int = 900  # seconds a dropped live recording may be resumed over HTTP
+    UPLOAD_SWEEP_INTERVAL: int = 60  # seconds between sweeps for abandoned upload sessions
+    UPLOAD_SESSION_TTL: int = 24 * 3600  # idle chunked uploads are deleted after this many seconds
+    
     # Local Application Mode
     ENABLE_LOCAL_MODE: bool = False
     
@@ -33,13 +66,40 @@ class Settings(BaseSettings):
     JIRA_BASE_URL: Optional[str] = None
     JIRA_EMAIL: Optional[str] = None
     JIRA_API_TOKEN: Optional[str] = None
+    JIRA_POOL_CONNECTIONS: int = 4  # distinct hosts kept in the connection pool
+    JIRA_POOL_MAXSIZE: int = 10  # keep-alive connections per host
+    JIRA_CONNECT_TIMEOUT: float = 5.0
+    JIRA_READ_TIMEOUT: float = 30.0
+    JIRA_BULK_BATCH_SIZE: int = 50  # Jira's per-request limit for bulk issue creation
+    JIRA_RATE_LIMIT: float = 10.0  # Max requests/second per Jira site (lowered automatically on 429)
+    JIRA_RATE_BURST: int = 20
+    JIRA_MAX_CONCURRENCY: int = 8
+    JIRA_ENDPOINT_CONCURRENCY: int = 4  # In-flight requests per endpoint
+    JIRA_MAX_RETRIES: int = 5
+    JIRA_RETRY_BACKOFF: float = 1.0  # Seconds; doubled per retry, with jitter
+    JIRA_RETRY_MAX_DELAY: float = 60.0
+    JIRA_USER_CACHE_TTL: int = 3600  # Seconds an owner -> accountId match is reused
+    JIRA_USER_NEGATIVE_TTL: int = 600  # Seconds a "no such user" result is reused
+    JIRA_METADATA_TTL: int = 900  # Seconds project issue types/priorities are cached
     
     # File upload
     MAX_UPLOAD_SIZE: int = 100 * 1024 * 1024  # 100MB
-    ALLOWED_AUDIO_FORMATS: List[str] = [".mp3", ".wav", ".m4a", ".ogg", ".flac"]
+    ALLOWED_AUDIO_FORMATS: List[str] = [".mp3", ".wav", ".m4a", ".ogg", ".flac", ".webm"]
     
     # Storage
     UPLOAD_DIR: str = "./uploads"
+    
+    # API
+    MEETINGS_PAGE_SIZE: int = 50
+    MEETINGS_MAX_PAGE_SIZE: int = 200
+    TRANSCRIPT_PAGE_SIZE: int = 100  # segments per /transcript page
+    TRANSCRIPT_MAX_PAGE_SIZE: int = 1000
+    
+    # Background job queue
+    JOB_WORKERS: int = 2
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_POLL_INTERVAL: float = 2.0  # seconds between queue polls when idle
+    JOB_RETRY_BACKOFF: float = 30.0  # base delay in seconds, doubled per attempt
 
 
 # Initialize settings - catch any errors
@@ -54,12 +114,56 @@ except Exception as e:
         CORS_ORIGINS = ["*"]
         GROQ_API_KEY = os.getenv("GROQ_API_KEY")
         LLM_MODEL = os.getenv("LLM_MODEL", "llama-3.1-70b-versatile")
+        OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+        LLM_CALL_TIMEOUT = float(os.getenv("LLM_CALL_TIMEOUT", "120.0"))
+        LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+        LLM_COMBINED_MODE = os.getenv("LLM_COMBINED_MODE", "False").lower() == "true"
+        LLM_CHUNK_CHARS = int(os.getenv("LLM_CHUNK_CHARS", "12000"))
+        LLM_CHUNK_OVERLAP = int(os.getenv("LLM_CHUNK_OVERLAP", "800"))
+        LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "True").lower() == "true"
+        LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", "./cache/llm")
+        LLM_CACHE_MEMORY_ENTRIES = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "256"))
+        LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", "52428800"))
         ASSEMBLYAI_API_KEY = os.getenv("ASSEMBLYAI_API_KEY")
+        AUDIO_PREPROCESSING_ENABLED = os.getenv("AUDIO_PREPROCESSING_ENABLED", "True").lower() == "true"
+        AUDIO_SAMPLE_RATE = int(os.getenv("AUDIO_SAMPLE_RATE", "16000"))
+        AUDIO_MAX_SILENCE = float(os.getenv("AUDIO_MAX_SILENCE", "1.0"))
+        AUDIO_BITRATE = os.getenv("AUDIO_BITRATE", "24k")
+        SEGMENTED_TRANSCRIPTION = os.getenv("SEGMENTED_TRANSCRIPTION", "False").lower() == "true"
+        TRANSCRIPTION_SEGMENT_SECONDS = float(os.getenv("TRANSCRIPTION_SEGMENT_SECONDS", "600"))
+        TRANSCRIPTION_CONCURRENCY = int(os.getenv("TRANSCRIPTION_CONCURRENCY", "4"))
+        LIVE_WINDOW_SECONDS = float(os.getenv("LIVE_WINDOW_SECONDS", "30.0"))
+        LIVE_RESUME_TIMEOUT = int(os.getenv("LIVE_RESUME_TIMEOUT", "900"))
+        UPLOAD_SWEEP_INTERVAL = int(os.getenv("UPLOAD_SWEEP_INTERVAL", "60"))
+        UPLOAD_SESSION_TTL = int(os.getenv("UPLOAD_SESSION_TTL", "86400"))
         ENABLE_LOCAL_MODE = os.getenv("ENABLE_LOCAL_MODE", "False").lower() == "true"
         JIRA_BASE_URL = os.getenv("JIRA_BASE_URL")
         JIRA_EMAIL = os.getenv("JIRA_EMAIL")
         JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
+        JIRA_POOL_CONNECTIONS = int(os.getenv("JIRA_POOL_CONNECTIONS", "4"))
+        JIRA_POOL_MAXSIZE = int(os.getenv("JIRA_POOL_MAXSIZE", "10"))
+        JIRA_CONNECT_TIMEOUT = float(os.getenv("JIRA_CONNECT_TIMEOUT", "5.0"))
+        JIRA_READ_TIMEOUT = float(os.getenv("JIRA_READ_TIMEOUT", "30.0"))
+        JIRA_BULK_BATCH_SIZE = int(os.getenv("JIRA_BULK_BATCH_SIZE", "50"))
+        JIRA_RATE_LIMIT = float(os.getenv("JIRA_RATE_LIMIT", "10.0"))
+        JIRA_RATE_BURST = int(os.getenv("JIRA_RATE_BURST", "20"))
+        JIRA_MAX_CONCURRENCY = int(os.getenv("JIRA_MAX_CONCURRENCY", "8"))
+        JIRA_ENDPOINT_CONCURRENCY = int(os.getenv("JIRA_ENDPOINT_CONCURRENCY", "4"))
+        JIRA_MAX_RETRIES = int(os.getenv("JIRA_MAX_RETRIES", "5"))
+        JIRA_RETRY_BACKOFF = float(os.getenv("JIRA_RETRY_BACKOFF", "1.0"))
+        JIRA_RETRY_MAX_DELAY = float(os.getenv("JIRA_RETRY_MAX_DELAY", "60.0"))
+        JIRA_USER_CACHE_TTL = int(os.getenv("JIRA_USER_CACHE_TTL", "3600"))
+        JIRA_USER_NEGATIVE_TTL = int(os.getenv("JIRA_USER_NEGATIVE_TTL", "600"))
+        JIRA_METADATA_TTL = int(os.getenv("JIRA_METADATA_TTL", "900"))
         MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", "104857600"))
-        ALLOWED_AUDIO_FORMATS = [".mp3", ".wav", ".m4a", ".ogg", ".flac"]
+        ALLOWED_AUDIO_FORMATS = [".mp3", ".wav", ".m4a", ".ogg", ".flac", ".webm"]
         UPLOAD_DIR = os.getenv("UPLOAD_DIR", "./uploads")
+        MEETINGS_PAGE_SIZE = int(os.getenv("MEETINGS_PAGE_SIZE", "50"))
+        MEETINGS_MAX_PAGE_SIZE = int(os.getenv("MEETINGS_MAX_PAGE_SIZE", "200"))
+        TRANSCRIPT_PAGE_SIZE = int(os.getenv("TRANSCRIPT_PAGE_SIZE", "100"))
+        TRANSCRIPT_MAX_PAGE_SIZE = int(os.getenv("TRANSCRIPT_MAX_PAGE_SIZE", "1000"))
+        JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+        JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+        JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "2.0"))
+        JOB_RETRY_BACKOFF = float(os.getenv("JOB_RETRY_BACKOFF", "30.0"))
     settings = SimpleSettings()
@@ -32,7 +32,7 @@ class Settings:
         # File upload
         self.MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", "104857600"))  # 100MB
         # Allow .txt transcripts in addition to audio formats
-        self.ALLOWED_AUDIO_FORMATS = [".mp3", ".wav", ".m4a", ".ogg", ".flac", ".txt"]
+        self.ALLOWED_AUDIO_FORMATS = [".mp3", ".wav", ".m4a", ".ogg", ".flac", ".webm", ".txt"]
         
         # Storage
         self.UPLOAD_DIR = os.getenv("UPLOAD_DIR", "./uploads")
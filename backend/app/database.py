@@ -1,12 +1,37 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./meeto.db"
 
+# Applied to every new SQLite connection. WAL lets the dashboard read while
+# job workers write; synchronous=NORMAL is durable across app crashes in WAL
+# mode (only an OS crash can lose the last commits).
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,  # ms to wait for a writer instead of failing with "database is locked"
+    "cache_size": -20000,  # negative = KiB, i.e. ~20MB page cache per connection
+    "temp_store": "MEMORY",
+    "mmap_size": 128 * 1024 * 1024,
+}
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -17,3 +42,39 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def migrate():
+    """
+    Upgrade an existing database in place.
+
+    create_all only creates missing tables, so columns and indexes added to a
+    model after its table was created are added here. New columns must be
+    nullable or have a server-side default. Planner statistics are refreshed
+    when anything changed.
+    """
+    inspector = inspect(engine)
+    changed = False
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            existing = {col["name"] for col in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                col_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {col_type}'))
+                print(f"Migrated: added column {table.name}.{column.name}")
+                changed = True
+
+            existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name in existing_indexes:
+                    continue
+                index.create(conn, checkfirst=True)
+                print(f"Migrated: created index {index.name}")
+                changed = True
+
+        if changed and engine.dialect.name == "sqlite":
+            conn.execute(text("ANALYZE"))
@@ -1,23 +1,42 @@
 """
 Meeto SaaS Backend
 """
-from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Depends, BackgroundTasks
+from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Depends, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Optional, Set
+import asyncio
+import base64
+import hashlib
 import os
-import shutil
 import uuid
 import json
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 
 from app.config import settings
-from app.database import engine, get_db, Base
-from app.models import Meeting, ActionItem
+from app.database import engine, get_db, Base, migrate, SessionLocal
+from app.models import Meeting, ActionItem, MeetingText, UploadSession, decompress_text, migrate_meeting_texts
+from app.schemas import MeetingListItem, MeetingPage, SearchResponse, TranscriptPage
 from app.services.jira_service import JiraService
+from app.services.job_queue import JobFailed, job_queue
+from app.services import upload_service
+from app.services.llm_cache import llm_cache
+from app.services.audio_preprocessor import audio_preprocessor
+from app.services.segmented_transcriber import build_segmented_transcriber
+from app.services.live_transcriber import LiveTranscriber
+from app.services.transcript_timeline import TranscriptTimeline
+from app.services.search_index import search_index
+from app.services.event_bus import event_bus
+from app.services.upload_service import UploadConflictError, UploadTooLargeError
+from app.middleware import MaxBodySizeMiddleware, SelectiveGZipMiddleware
+from app.responses import RangeFileResponse
 
 # Initialize services
 try:
@@ -28,14 +47,21 @@ except Exception as e:
     print(f"Warning: AssemblyAI service not available: {e}")
     transcription_service = None
 
+segmented_transcriber = build_segmented_transcriber(transcription_service)
+
+# Upload session ids with a connected /ws/live socket
+_live_sessions: Set[str] = set()
+
 try:
     from app.services.llm_service import llm_service
 except Exception as e:
     print(f"Warning: LLM service not available: {e}")
     llm_service = None
 
-# Create tables
+# Create tables and upgrade existing databases
 Base.metadata.create_all(bind=engine)
+migrate()
+migrate_meeting_texts()
 
 app = FastAPI(
     title="Meeto SaaS",
@@ -51,125 +77,904 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Transcripts compress well; the event stream must not be buffered and audio is already compressed
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    minimum_size=1024,
+    exclude_prefixes=("/api/events",),
+    exclude_suffixes=("/audio",)
+)
+
+# Cut off oversized uploads while they stream in; multipart framing gets some headroom
+app.add_middleware(
+    MaxBodySizeMiddleware,
+    max_size=settings.MAX_UPLOAD_SIZE,
+    headroom=64 * 1024,
+    path_prefixes=("/api/upload",)
+)
+
 # Ensure upload directory exists
 Path(settings.UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
 
 # --- Background Tasks ---
-def process_meeting_background(meeting_id: int, db: Session):
+def _reuse_processed_meeting(db: Session, meeting: Meeting) -> bool:
+    """
+    Copy transcript, summary and action items from a completed meeting with the
+    same audio hash, skipping transcription and LLM calls. Returns True if reused.
+    """
+    if not meeting.audio_hash:
+        return False
+
+    source = (
+        db.query(Meeting)
+        .options(selectinload(Meeting.text_store), selectinload(Meeting.action_items))
+        .filter(Meeting.audio_hash == meeting.audio_hash, Meeting.id != meeting.id, Meeting.status == "COMPLETED")
+        .order_by(Meeting.id)
+        .first()
+    )
+    if not source or not source.transcript_text:
+        return False
+
+    meeting.transcript_text = source.transcript_text
+    meeting.transcript_timeline = source.transcript_timeline
+    meeting.summary_text = source.summary_text
+    for item in source.action_items:
+        db.add(ActionItem(
+            meeting_id=meeting.id,
+            description=item.description,
+            owner=item.owner,
+            priority=item.priority
+        ))
+    meeting.status = "COMPLETED"
+    db.commit()
+    _index_for_search(db, meeting)
+    _publish_meeting(meeting, "completed")
+    print(f"Meeting {meeting.id} reused results of meeting {source.id} (same audio)")
+    return True
+
+
+def _publish_meeting(meeting: Meeting, stage: str):
+    """
+    Push a meeting's progress to /api/events subscribers.
+
+    stage is one of recording, uploaded, transcribing, extracting,
+    completed, error. Call after committing, so listeners that re-fetch
+    see the new state.
+    """
+    event_bus.publish("meeting", {
+        "meeting_id": meeting.id,
+        "stage": stage,
+        "status": meeting.status,
+        "title": meeting.title,
+        "timestamp": meeting.timestamp.isoformat() if meeting.timestamp else None
+    })
+
+
+def _index_for_search(db: Session, meeting: Meeting):
+    """Update the meeting's full-text search entry; failures only cost searchability"""
+    if not search_index:
+        return
+    try:
+        search_index.index_meeting(db, meeting)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"Search indexing failed for meeting {meeting.id}: {e}")
+
+def process_meeting_background(meeting_id: int, db: Session, transcribed: bool = False):
+    """
+    Job handler: transcribe a meeting and extract its summary and action items.
+
+    Runs on a job queue worker with the worker's own session. Transcription
+    errors are re-raised so the queue can retry the job. transcribed=True
+    skips transcription for meetings whose transcript was built live.
+
+    Idempotent: a job re-run after it already completed the meeting (e.g. its
+    DONE status was never committed) does nothing.
+    """
     try:
         meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
         if not meeting:
             return
+        if meeting.status == "COMPLETED":
+            print(f"Meeting {meeting_id} already processed")
+            return
 
         print(f"Processing meeting {meeting_id}...")
+        meeting.status = "PROCESSING"
+        db.commit()
 
-        # 1. Transcribe (AssemblyAI)
-        if not transcription_service:
-            print("Transcription service missing")
-            meeting.status = "ERROR"
-            db.commit()
+        if _reuse_processed_meeting(db, meeting):
             return
 
-        try:
-            transcript_result = transcription_service.transcribe(meeting.audio_path)
-            meeting.transcript_text = transcript_result["text"]
-            db.commit()
-        except Exception as e:
-            print(f"Transcription failed: {e}")
-            meeting.status = "ERROR"
-            db.commit()
-            return
+        # 1. Transcribe (AssemblyAI) - already done if the meeting was transcribed live
+        if not (transcribed and meeting.transcript_text):
+            if not transcription_service:
+                print("Transcription service missing")
+                meeting.status = "ERROR"
+                db.commit()
+                _publish_meeting(meeting, "error")
+                return
 
-        # 2. Extract Action Items & Summary
-        if llm_service:
-            try:
-                llm_result = llm_service.extract_action_items(meeting.transcript_text)
-                action_items_data = llm_result.get("tasks", [])
-                
-                # Save Action Items
-                for item in action_items_data:
-                    action_item = ActionItem(
-                        meeting_id=meeting.id,
-                        description=item.get("description"),
-                        owner=item.get("owner"),
-                        priority=item.get("priority", "Medium")
+            _publish_meeting(meeting, "transcribing")
+
+            # Smaller mono 16 kHz audio without long silences uploads and transcribes faster
+            audio_path = meeting.audio_path
+            prep = None
+            if audio_preprocessor:
+                prep = audio_preprocessor.preprocess(meeting.audio_path)
+                audio_path = prep.path
+                if prep.path != meeting.audio_path:
+                    print(
+                        f"Pre-processed audio for meeting {meeting_id}: "
+                        f"{prep.original_bytes} -> {prep.processed_bytes} bytes ({prep.bytes_saved} saved), "
+                        f"{prep.original_duration:.0f}s -> {prep.processed_duration:.0f}s"
                     )
-                    db.add(action_item)
-                
-                # Summary
-                meeting.summary_text = llm_service.summarize_transcript(meeting.transcript_text)
-                
+
+            try:
+                # Long recordings can be split and transcribed in parallel
+                transcriber = segmented_transcriber or transcription_service
+                transcript_result = transcriber.transcribe(audio_path)
+                meeting.transcript_text = transcript_result["text"]
+                # Timings refer to the trimmed audio; store them against the original recording
+                time_map = prep.to_original_time if prep and prep.path != meeting.audio_path else None
+                meeting.transcript_timeline = TranscriptTimeline.from_result(transcript_result, time_map)
+                db.commit()
             except Exception as e:
-                print(f"LLM processing failed: {e}")
+                print(f"Transcription failed: {e}")
+                raise
+            finally:
+                # The trimmed copy is only needed for the request; keep one copy per recording
+                if prep and prep.path != meeting.audio_path and os.path.exists(prep.path):
+                    os.remove(prep.path)
+
+        # 2. Extract Action Items & Summary (concurrently; either may fail on its own)
+        if llm_service:
+            _publish_meeting(meeting, "extracting")
+            llm_result = llm_service.process_transcript(meeting.transcript_text)
+            for stage, error in llm_result["errors"].items():
+                print(f"LLM {stage} failed for meeting {meeting_id}: {error}")
+
+            # Save Action Items
+            for item in llm_result["tasks"] or []:
+                action_item = ActionItem(
+                    meeting_id=meeting.id,
+                    description=item.get("description"),
+                    owner=item.get("owner"),
+                    priority=item.get("priority", "Medium")
+                )
+                db.add(action_item)
+
+            # Summary
+            if llm_result["summary"] is not None:
+                meeting.summary_text = llm_result["summary"]
 
         meeting.status = "COMPLETED"
         db.commit()
+        _index_for_search(db, meeting)
+        _publish_meeting(meeting, "completed")
         print(f"Meeting {meeting_id} processing complete.")
 
     except Exception as e:
+        # The queue retries; the meeting stays PROCESSING until the last attempt fails
         print(f"Error processing meeting {meeting_id}: {e}")
-        # Re-query in case session detached
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-        if meeting:
-            meeting.status = "ERROR"
-            db.commit()
+        raise
+
+
+def process_meeting_failed(meeting_id: int, db: Session, error: Exception, **_):
+    """Job failure hook: mark the meeting ERROR once its processing job has given up"""
+    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    if meeting:
+        meeting.status = "ERROR"
+        db.commit()
+        _publish_meeting(meeting, "error")
+
+
+def _publish_jira_sync(job_id: int, meeting_id: int, progress: Optional[dict], done: bool = False, error: Optional[str] = None):
+    event_bus.publish("jira_sync", {
+        "job_id": job_id,
+        "meeting_id": meeting_id,
+        "progress": progress,
+        "done": done,
+        "error": error
+    })
+
+
+def sync_jira_failed(meeting_id: int, db: Session, job_id: int, error: Exception, **_):
+    """Job failure hook: tell the dashboard a Jira sync has given up"""
+    job = job_queue.get(db, job_id)
+    _publish_jira_sync(job_id, meeting_id, job["progress"] if job else None, done=True, error=str(error))
+
+
+def sync_jira_background(meeting_id: int, project_key: str, item_ids: List[int], db: Session, job_id: int):
+    """
+    Create Jira issues for a meeting's unsynced action items.
+
+    Items are committed batch by batch as Jira confirms them, so a retry
+    or a crash only redoes the items that were not created yet. Progress
+    (total/created/failed/pending) is kept on the job for /api/jobs/{id}.
+    The final event of a job that fails is sent by sync_jira_failed.
+    """
+    def publish(progress: dict = None, done: bool = False):
+        _publish_jira_sync(job_id, meeting_id, progress, done=done)
+
+    meeting = (
+        db.query(Meeting)
+        .options(selectinload(Meeting.action_items))
+        .filter(Meeting.id == meeting_id)
+        .first()
+    )
+    if not meeting:
+        raise JobFailed(f"Meeting {meeting_id} not found")
+
+    try:
+        jira_service = JiraService()
+    except ValueError as e:
+        raise JobFailed(str(e))
+
+    tracked = [item for item in meeting.action_items if item.id in set(item_ids)]
+    pending = [item for item in tracked if not item.jira_ticket_key]
+    errors: dict = {}
+
+    def report(done: bool = False):
+        created = sum(1 for item in tracked if item.jira_ticket_key)
+        progress = {
+            "total": len(tracked),
+            "created": created,
+            "failed": len(errors),
+            "pending": len(tracked) - created - len(errors),
+            "errors": [{"item_id": item_id, "error": error} for item_id, error in errors.items()]
+        }
+        job_queue.set_progress(db, job_id, progress)
+        db.commit()
+        publish(progress, done=done)
+
+    if not pending:
+        report(done=True)
+        return
+    report()
+
+    # Validate against cached project metadata before spending any create/user requests
+    try:
+        fields = [jira_service.normalize_issue_fields(project_key, "Task", item.priority) for item in pending]
+    except ValueError as e:
+        raise JobFailed(str(e))
+
+    # One lookup per distinct owner, shared across syncs through the resolver's cache
+    account_ids = jira_service.resolve_account_ids([item.owner for item in pending], project_key)
+
+    issues = [
+        jira_service.build_issue_fields(
+            summary=item.description[:255],
+            description=f"From Meeting: {meeting.title}\n\nOwner: {item.owner}\n\n{item.description}",
+            project_key=project_key,
+            issue_type=issue_type,
+            priority=priority,
+            assignee=account_ids.get(item.owner)
+        )
+        for item, (issue_type, priority) in zip(pending, fields)
+    ]
+
+    def save_batch(start: int, results: list):
+        for item, result in zip(pending[start:start + len(results)], results):
+            if "error" in result:
+                errors[item.id] = result["error"]
+                print(f"Failed to sync item {item.id}: {result['error']}")
+                continue
+            item.jira_ticket_key = result['key']
+            item.jira_ticket_url = f"{settings.JIRA_BASE_URL}/browse/{result['key']}"
+        report()
+
+    jira_service.create_issues_bulk(issues, on_batch=save_batch)
+    report(done=True)
+    print(f"Jira sync for meeting {meeting_id}: {len(pending) - len(errors)} created, {len(errors)} failed")
+
+
+job_queue.register("process_meeting", process_meeting_background, on_failure=process_meeting_failed)
+job_queue.register("sync_jira", sync_jira_background, pass_job_id=True, on_failure=sync_jira_failed)
+
+
+@app.on_event("startup")
+def start_job_queue():
+    job_queue.start()
+
+
+@app.on_event("startup")
+def backfill_search_index():
+    """Index meetings completed before search existed (or whose indexing failed)"""
+    if not search_index:
+        return
+    db = SessionLocal()
+    try:
+        count = search_index.backfill(db)
+        if count:
+            print(f"Search index: indexed {count} meeting(s)")
+    except Exception as e:
+        # Search is optional; never keep the app from starting
+        print(f"Search index backfill failed: {e}")
+    finally:
+        db.close()
+
+
+@app.on_event("startup")
+async def start_upload_sweep():
+    app.state.upload_sweep = asyncio.create_task(_sweep_upload_sessions())
+
+
+@app.on_event("shutdown")
+def stop_job_queue():
+    job_queue.stop()
+
+
+@app.on_event("shutdown")
+async def stop_upload_sweep():
+    app.state.upload_sweep.cancel()
 
 # --- API Endpoints ---
 
 @app.post("/api/upload-stream")
 async def upload_stream(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db)
 ):
     """endpoint for Chrome Extension to upload audio blob"""
     
-    # Save file
-    file_ext = ".webm" # Extension usually sends webm
-    filename = f"{uuid.uuid4()}{file_ext}"
-    file_path = os.path.join(settings.UPLOAD_DIR, filename)
+    # Extension usually sends webm
+    try:
+        file_ext = upload_service.check_audio_format(file.filename)
+    except ValueError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+
+    filename = f"{uuid.uuid4()}{file_ext}.part"
+    temp_path = os.path.join(settings.UPLOAD_DIR, filename)
+
+    # Stream to disk off the event loop, enforcing the size limit and hashing as we go
+    try:
+        file_size, audio_hash = await upload_service.save_upload(file, temp_path)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
 
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+    # Audio is stored once per content hash
+    file_path = await run_in_threadpool(upload_service.store_by_hash, temp_path, audio_hash, file_ext)
 
-    # Create Meeting record
+    # Retried or repeated uploads of the same recording reuse the earlier meeting
+    existing = upload_service.find_meeting_by_hash(db, audio_hash)
+    if existing:
+        return {"success": True, "meeting_id": existing.id, "duplicate": True, "size": file_size, "sha256": audio_hash}
+
+    return _create_meeting_for_audio(db, file_path, audio_hash) | {"size": file_size, "sha256": audio_hash}
+
+def _create_meeting_for_audio(db: Session, file_path: str, audio_hash: str) -> dict:
+    """Create a Meeting row for stored audio and queue it for processing"""
     new_meeting = Meeting(
         title=f"Meeting {datetime.now().strftime('%Y-%m-%d %H:%M')}",
         audio_path=file_path,
+        audio_hash=audio_hash,
         status="PROCESSING"
     )
     db.add(new_meeting)
+    db.flush()
+
+    # Queue processing; committed together with the meeting row
+    job_queue.enqueue("process_meeting", {"meeting_id": new_meeting.id}, db=db)
+    _publish_meeting(new_meeting, "uploaded")
+
+    return {"success": True, "meeting_id": new_meeting.id, "duplicate": False}
+
+def _upload_session_state(upload) -> dict:
+    return {
+        "session_id": upload.id,
+        "status": upload.status,
+        "next_chunk": upload.next_chunk,
+        "offset": upload.bytes_received,
+        "meeting_id": upload.meeting_id
+    }
+
+@app.post("/api/upload-sessions")
+def create_upload_session(db: Session = Depends(get_db)):
+    """Start a resumable chunked upload"""
+    upload = upload_service.create_session(db)
+    return _upload_session_state(upload)
+
+@app.get("/api/upload-sessions/{session_id}")
+def get_upload_session(session_id: str, db: Session = Depends(get_db)):
+    """Report the last acknowledged chunk/offset so a client can resume"""
+    upload = upload_service.get_session(db, session_id)
+    if not upload:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    return _upload_session_state(upload)
+
+@app.put("/api/upload-sessions/{session_id}/chunks/{index}")
+async def upload_chunk(session_id: str, index: int, request: Request, db: Session = Depends(get_db)):
+    """Append one numbered chunk (raw request body) to an upload session"""
+    upload = upload_service.get_session(db, session_id)
+    if not upload:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+
+    data = await request.body()
+    try:
+        upload = await run_in_threadpool(upload_service.append_chunk, db, upload, index, data)
+    except UploadConflictError as e:
+        return JSONResponse(status_code=409, content={"detail": str(e), **_upload_session_state(e.session)})
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    return _upload_session_state(upload)
+
+def _finish_live_meeting(db: Session, meeting: Meeting, file_path: str, audio_hash: str):
+    """Attach the finalized recording of a dropped live session and queue a full transcription"""
+    meeting.audio_path = file_path
+    meeting.audio_hash = audio_hash
+    meeting.status = "PROCESSING"
+    job_queue.enqueue("process_meeting", {"meeting_id": meeting.id}, db=db)
+    _publish_meeting(meeting, "uploaded")
+
+
+def _finish_abandoned_recordings(db: Session) -> int:
+    """
+    Finish live recordings whose WebSocket dropped and that were not resumed
+    over HTTP within LIVE_RESUME_TIMEOUT: process what was received, or mark
+    the meeting ERROR if nothing was. Returns the number of sessions closed.
+
+    A session that fails is logged and left for a later sweep; one whose
+    part file is gone can never be finished and is closed as ERROR.
+    """
+    closed = 0
+    for upload in upload_service.stale_sessions(db, settings.LIVE_RESUME_TIMEOUT, live=True):
+        if upload.id in _live_sessions:
+            continue  # Still connected, just quiet
+        upload_id = upload.id
+        try:
+            if _finish_abandoned_recording(db, upload):
+                closed += 1
+        except Exception as e:
+            db.rollback()
+            print(f"Could not finish abandoned live recording {upload_id}: {e}")
+    return closed
+
+
+def _finish_abandoned_recording(db: Session, upload: UploadSession) -> bool:
+    meeting = db.query(Meeting).filter(Meeting.id == upload.meeting_id).first()
+    if upload.bytes_received:
+        try:
+            file_path, audio_hash = upload_service.finalize_session(db, upload)
+        except UploadConflictError:
+            return False  # The client resumed and finalized it meanwhile
+        except FileNotFoundError:
+            # Nothing left to process; close it like an empty recording
+            print(f"Part file of abandoned live recording {upload.id} is missing")
+        else:
+            if meeting:
+                _finish_live_meeting(db, meeting, file_path, audio_hash)
+            print(f"Finished abandoned live recording {upload.id} (meeting {upload.meeting_id})")
+            db.commit()
+            return True
+
+    if not upload_service.expire_session(db, upload):
+        return False
+    if meeting:
+        meeting.status = "ERROR"
+        _publish_meeting(meeting, "error")
     db.commit()
-    db.refresh(new_meeting)
+    return True
 
-    # Trigger background processing
-    background_tasks.add_task(process_meeting_background, new_meeting.id, db)
 
-    return {"success": True, "meeting_id": new_meeting.id}
+def _expire_stale_uploads(db: Session) -> int:
+    """Delete the part files of chunked uploads idle for UPLOAD_SESSION_TTL. Returns the count."""
+    expired = 0
+    for upload in upload_service.stale_sessions(db, settings.UPLOAD_SESSION_TTL, live=False):
+        upload_id = upload.id
+        try:
+            if upload_service.expire_session(db, upload):
+                expired += 1
+        except Exception as e:
+            db.rollback()
+            print(f"Could not expire upload session {upload_id}: {e}")
+    if expired:
+        print(f"Expired {expired} stale upload session(s)")
+    return expired
+
+
+def _sweep_stale_sessions(db: Session) -> None:
+    for sweep in (_finish_abandoned_recordings, _expire_stale_uploads):
+        try:
+            sweep(db)
+        except Exception as e:
+            db.rollback()
+            print(f"Upload session sweep step {sweep.__name__} failed: {e}")
 
-@app.get("/api/meetings")
-def list_meetings(db: Session = Depends(get_db)):
-    meetings = db.query(Meeting).order_by(Meeting.timestamp.desc()).all()
-    if not meetings:
-        return []
-    return meetings
+
+async def _sweep_upload_sessions():
+    """Background loop closing abandoned upload sessions"""
+    while True:
+        await asyncio.sleep(settings.UPLOAD_SWEEP_INTERVAL)
+        db = SessionLocal()
+        try:
+            await run_in_threadpool(_sweep_stale_sessions, db)
+        except Exception as e:
+            db.rollback()
+            print(f"Upload session sweep failed: {e}")
+        finally:
+            db.close()
+
+@app.post("/api/upload-sessions/{session_id}/finalize")
+async def finalize_upload_session(session_id: str, db: Session = Depends(get_db)):
+    """Close an upload session and queue the recording for processing"""
+    upload = upload_service.get_session(db, session_id)
+    if not upload:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+
+    # Finalize is idempotent so a client can safely retry it
+    if upload.status == "FINALIZED":
+        return {"success": True, "meeting_id": upload.meeting_id}
+
+    if upload.bytes_received == 0:
+        raise HTTPException(status_code=400, detail="Upload session is empty")
+
+    try:
+        file_path, audio_hash = await run_in_threadpool(upload_service.finalize_session, db, upload)
+    except UploadConflictError as e:
+        # Another request claimed the session first; a retry will see it FINALIZED
+        if e.session.status == "FINALIZED":
+            return {"success": True, "meeting_id": e.session.meeting_id}
+        return JSONResponse(status_code=409, content={"detail": str(e), **_upload_session_state(e.session)})
+
+    # A live recording whose WebSocket dropped: finish its meeting with a full transcription
+    if upload.meeting_id:
+        live_meeting = db.query(Meeting).filter(Meeting.id == upload.meeting_id).first()
+        if live_meeting:
+            _finish_live_meeting(db, live_meeting, file_path, audio_hash)
+            return {"success": True, "meeting_id": live_meeting.id, "duplicate": False}
+
+    existing = upload_service.find_meeting_by_hash(db, audio_hash)
+    if existing:
+        upload.meeting_id = existing.id
+        db.commit()
+        return {"success": True, "meeting_id": existing.id, "duplicate": True}
+
+    result = _create_meeting_for_audio(db, file_path, audio_hash)
+    upload.meeting_id = result["meeting_id"]
+    db.commit()
+    return result
+
+@app.websocket("/ws/live")
+async def live_recording(websocket: WebSocket):
+    """
+    Live ingestion of MediaRecorder chunks during a meeting.
+
+    Protocol: the server sends {"type": "ready", "meeting_id", "session_id"};
+    the client sends each chunk as a binary frame and receives
+    {"type": "ack", "next_chunk"}; new transcript text is pushed as
+    {"type": "transcript", "text"}. The client sends {"type": "stop"} to
+    finish and gets {"type": "done", "meeting_id"}. If the socket drops
+    first, the client can continue through the chunked upload endpoints
+    with the same session_id.
+    """
+    await websocket.accept()
+    db = SessionLocal()
+    db_lock = asyncio.Lock()  # appends run in a threadpool; keep session use serial
+    window_task: Optional[asyncio.Task] = None
+    upload = None
+    live = None
+    try:
+        upload = upload_service.create_session(db)
+        meeting = Meeting(
+            title=f"Meeting {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+            status="RECORDING"
+        )
+        db.add(meeting)
+        db.flush()
+        upload.meeting_id = meeting.id
+        db.commit()
+        _publish_meeting(meeting, "recording")
+
+        _live_sessions.add(upload.id)
+        live = None
+        if transcription_service and audio_preprocessor:
+            try:
+                live = LiveTranscriber(transcription_service, audio_preprocessor, settings.LIVE_WINDOW_SECONDS)
+            except Exception as e:
+                print(f"Live transcription unavailable for meeting {meeting.id}: {e}")
+        live_ok = live is not None
+
+        async def transcribe_window(final: bool = False):
+            nonlocal live_ok
+            try:
+                text = await run_in_threadpool(live.transcribe_available, final)
+            except Exception as e:
+                # Fall back to a full transcription after the meeting
+                print(f"Live transcription failed for meeting {meeting.id}: {e}")
+                live_ok = False
+                return
+            if text:
+                async with db_lock:
+                    meeting.transcript_text = f"{meeting.transcript_text or ''} {text}".strip()
+                    db.commit()
+                await websocket.send_json({"type": "transcript", "text": text})
+
+        await websocket.send_json({"type": "ready", "meeting_id": meeting.id, "session_id": upload.id})
+
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                # Leave the session open so the client can resume over HTTP;
+                # _finish_abandoned_recordings takes over if it never does
+                return
+
+            if message.get("bytes") is not None:
+                try:
+                    async with db_lock:
+                        await run_in_threadpool(upload_service.append_chunk, db, upload, upload.next_chunk, message["bytes"])
+                except UploadTooLargeError as e:
+                    await websocket.send_json({"type": "error", "detail": str(e)})
+                    break
+                await websocket.send_json({"type": "ack", "next_chunk": upload.next_chunk})
+
+                if live_ok:
+                    try:
+                        await run_in_threadpool(live.feed, message["bytes"])
+                    except Exception as e:
+                        print(f"Live decoding failed for meeting {meeting.id}: {e}")
+                        live_ok = False
+
+                # At most one window in flight; it returns at once until enough new audio is decoded
+                if live_ok and (window_task is None or window_task.done()):
+                    window_task = asyncio.create_task(transcribe_window())
+                continue
+
+            try:
+                control = json.loads(message.get("text") or "{}")
+            except ValueError:
+                control = {}
+            if control.get("type") == "stop":
+                break
+
+        # Stop: transcribe the tail, store the audio and queue the LLM pass
+        if window_task:
+            await window_task
+        if live_ok:
+            await transcribe_window(final=True)
+
+        async with db_lock:
+            if upload.bytes_received == 0:
+                upload_service.expire_session(db, upload)
+                meeting.status = "ERROR"
+                db.commit()
+                _publish_meeting(meeting, "error")
+                await websocket.send_json({"type": "error", "detail": "No audio received"})
+                return
+
+            try:
+                file_path, audio_hash = await run_in_threadpool(upload_service.finalize_session, db, upload)
+            except UploadConflictError:
+                # Finalized over HTTP meanwhile; that request queued the meeting
+                await websocket.send_json({"type": "done", "meeting_id": meeting.id})
+                return
+            meeting.audio_path = file_path
+            meeting.audio_hash = audio_hash
+            if live_ok:
+                meeting.transcript_timeline = TranscriptTimeline.from_result(live.result())
+            meeting.status = "PROCESSING"
+            job_queue.enqueue("process_meeting", {"meeting_id": meeting.id, "transcribed": live_ok}, db=db)
+            _publish_meeting(meeting, "uploaded")
+
+        await websocket.send_json({"type": "done", "meeting_id": meeting.id})
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if window_task and not window_task.done():
+            window_task.cancel()
+        if live:
+            live.close()
+        if upload:
+            _live_sessions.discard(upload.id)
+        db.close()
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    True if the client's cached copy is current (RFC 9110 precedence:
+    If-None-Match, when sent, decides; otherwise If-Modified-Since).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison: gzip may have changed the bytes, not the content
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        # HTTP dates have whole-second precision
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def _cache_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    # no-cache: browsers keep the body but revalidate every time, getting a 304 when unchanged
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+    return headers
+
+
+def _encode_cursor(timestamp: datetime, meeting_id: int) -> str:
+    raw = f"{timestamp.isoformat()}|{meeting_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        timestamp, meeting_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(meeting_id)
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@app.get("/api/meetings", response_model=MeetingPage)
+def list_meetings(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.MEETINGS_PAGE_SIZE, ge=1, le=settings.MEETINGS_MAX_PAGE_SIZE),
+    status: Optional[str] = Query(None, description="Comma-separated statuses, e.g. COMPLETED,ERROR"),
+    db: Session = Depends(get_db)
+):
+    """
+    Meetings newest first, keyset-paginated on (timestamp, id).
+
+    Only the list columns are selected, so the cost of a page does not grow
+    with the number of meetings or the size of their transcripts. Answers
+    304 when the client's ETag still matches.
+    """
+    query = db.query(Meeting.id, Meeting.title, Meeting.timestamp, Meeting.status, Meeting.version, Meeting.updated_at)
+
+    if status:
+        statuses = [s.strip().upper() for s in status.split(",") if s.strip()]
+        query = query.filter(Meeting.status.in_(statuses))
+
+    if cursor:
+        timestamp, meeting_id = _decode_cursor(cursor)
+        query = query.filter(or_(
+            Meeting.timestamp < timestamp,
+            and_(Meeting.timestamp == timestamp, Meeting.id < meeting_id)
+        ))
+
+    # One extra row tells us whether there is a next page
+    rows = query.order_by(Meeting.timestamp.desc(), Meeting.id.desc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].timestamp, rows[-1].id)
+
+    # The page changes exactly when its membership or one of its meetings' versions does
+    fingerprint = repr(([(r.id, r.version) for r in rows], next_cursor, limit, status, cursor))
+    etag = f'W/"meetings-{hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()}"'
+    last_modified = max((r.updated_at or r.timestamp for r in rows if r.updated_at or r.timestamp), default=None)
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=_cache_headers(etag, last_modified))
+
+    page = MeetingPage(
+        items=[MeetingListItem(id=r.id, title=r.title, timestamp=r.timestamp, status=r.status) for r in rows],
+        next_cursor=next_cursor
+    )
+    return JSONResponse(jsonable_encoder(page), headers=_cache_headers(etag, last_modified))
 
 @app.get("/api/meetings/{meeting_id}")
-def get_meeting(meeting_id: int, db: Session = Depends(get_db)):
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+def get_meeting(
+    meeting_id: int,
+    request: Request,
+    include_transcript: bool = True,
+    db: Session = Depends(get_db)
+):
+    """
+    A meeting with its summary and action items. With include_transcript=false
+    the transcript is left out; page it through /api/meetings/{id}/transcript.
+    """
+    # Check freshness before loading (and decompressing) the transcript
+    current = db.query(Meeting.version, Meeting.updated_at, Meeting.timestamp).filter(Meeting.id == meeting_id).first()
+    if not current:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+
+    variant = "" if include_transcript else "-notranscript"
+    etag = f'W/"meeting-{meeting_id}-v{current.version or 0}{variant}"'
+    last_modified = current.updated_at or current.timestamp
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=_cache_headers(etag, last_modified))
+
+    # Never the timings, and the transcript blob only when it is returned
+    texts = selectinload(Meeting.text_store).defer(MeetingText.timeline)
+    if not include_transcript:
+        texts = texts.defer(MeetingText.transcript)
+    meeting = (
+        db.query(Meeting)
+        .options(texts, selectinload(Meeting.action_items))
+        .filter(Meeting.id == meeting_id)
+        .first()
+    )
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
     # Include action items
-    return {
+    body = {
         "id": meeting.id,
         "title": meeting.title,
         "timestamp": meeting.timestamp,
         "status": meeting.status,
-        "transcript": meeting.transcript_text,
         "summary": meeting.summary_text,
-        "action_items": meeting.action_items
+        "action_items": meeting.action_items,
+        "audio_url": f"/api/meetings/{meeting.id}/audio" if meeting.audio_path else None
     }
+    if include_transcript:
+        body["transcript"] = meeting.transcript_text
+    return JSONResponse(jsonable_encoder(body), headers=_cache_headers(etag, last_modified))
+
+@app.get("/api/meetings/{meeting_id}/transcript", response_model=TranscriptPage)
+def get_meeting_transcript(
+    meeting_id: int,
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(settings.TRANSCRIPT_PAGE_SIZE, ge=1, le=settings.TRANSCRIPT_MAX_PAGE_SIZE),
+    words: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    Transcript segments offset..offset+limit with their start/end times in
+    seconds, and word timings when words=true.
+
+    Meetings transcribed before timings were stored are split into untimed
+    sentences (has_timings is false).
+    """
+    current = db.query(Meeting.version, Meeting.updated_at, Meeting.timestamp).filter(Meeting.id == meeting_id).first()
+    if not current:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+
+    etag = f'W/"transcript-{meeting_id}-v{current.version or 0}-{offset}-{limit}-{int(words)}"'
+    last_modified = current.updated_at or current.timestamp
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=_cache_headers(etag, last_modified))
+
+    # Only the timings column; the transcript is read just for meetings stored without timings
+    blob = db.query(MeetingText.timeline).filter(MeetingText.meeting_id == meeting_id).scalar()
+    if blob is not None:
+        timeline = TranscriptTimeline.from_bytes(blob, include_words=words)
+    else:
+        transcript = db.query(MeetingText.transcript).filter(MeetingText.meeting_id == meeting_id).scalar()
+        timeline = TranscriptTimeline.from_text(decompress_text(transcript))
+
+    page = TranscriptPage(
+        meeting_id=meeting_id,
+        total=len(timeline),
+        offset=offset,
+        limit=limit,
+        has_timings=timeline.has_timings,
+        segments=timeline.page(offset, limit, include_words=words)
+    )
+    exclude = None if words else {"segments": {"__all__": {"words"}}}
+    return JSONResponse(jsonable_encoder(page, exclude=exclude), headers=_cache_headers(etag, last_modified))
+
+@app.api_route("/api/meetings/{meeting_id}/audio", methods=["GET", "HEAD"])
+def get_meeting_audio(meeting_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    The meeting's original recording, with byte-range support so players can
+    seek (e.g. to a transcript segment's start) without downloading it all.
+    """
+    audio_path = db.query(Meeting.audio_path).filter(Meeting.id == meeting_id).scalar()
+    if not audio_path:
+        raise HTTPException(status_code=404, detail="Meeting has no audio")
+
+    # Only ever serve files from the upload directory
+    upload_dir = os.path.realpath(settings.UPLOAD_DIR)
+    path = os.path.realpath(audio_path)
+    if os.path.commonpath([upload_dir, path]) != upload_dir or not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Audio file not found")
+
+    return RangeFileResponse(path, request.headers, method=request.method)
 
 @app.post("/api/meetings/{meeting_id}/sync-jira")
 def sync_jira(
@@ -177,7 +982,12 @@ def sync_jira(
     project_key: str = Form(...),
     db: Session = Depends(get_db)
 ):
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    meeting = (
+        db.query(Meeting)
+        .options(selectinload(Meeting.action_items))
+        .filter(Meeting.id == meeting_id)
+        .first()
+    )
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
@@ -188,34 +998,76 @@ def sync_jira(
     if not all([settings.JIRA_BASE_URL, settings.JIRA_EMAIL, settings.JIRA_API_TOKEN]):
         raise HTTPException(status_code=500, detail="Jira credentials missing")
 
-    jira_service = JiraService(
-        base_url=settings.JIRA_BASE_URL,
-        email=settings.JIRA_EMAIL,
-        api_token=settings.JIRA_API_TOKEN
+    pending_ids = [item.id for item in meeting.action_items if not item.jira_ticket_key]
+    if not pending_ids:
+        return {"success": True, "job_id": None, "pending_count": 0}
+
+    # A sync already queued for this meeting and project will pick these items up
+    job_id = job_queue.find_active(db, "sync_jira", meeting_id=meeting_id, project_key=project_key)
+    if job_id is None:
+        # Syncing the same items to another project at once would create them twice
+        other_job_id = job_queue.find_active(db, "sync_jira", meeting_id=meeting_id)
+        if other_job_id is not None:
+            raise HTTPException(
+                status_code=409,
+                detail=f"A Jira sync to another project is already in progress for this meeting (job {other_job_id})"
+            )
+        job_id = job_queue.enqueue("sync_jira", {
+            "meeting_id": meeting_id,
+            "project_key": project_key,
+            "item_ids": pending_ids
+        }, db=db)
+
+    return {"success": True, "job_id": job_id, "pending_count": len(pending_ids)}
+
+
+@app.get("/api/events")
+async def events(request: Request):
+    """
+    Server-Sent Events stream of meeting stage changes ("meeting") and Jira
+    sync progress ("jira_sync"). Reconnecting clients get missed events
+    replayed from Last-Event-ID while they are still buffered.
+    """
+    try:
+        last_event_id = int(request.headers.get("last-event-id", ""))
+    except ValueError:
+        last_event_id = None
+
+    return StreamingResponse(
+        event_bus.stream(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
-    created_ct = 0
-    for item in meeting.action_items:
-        if item.jira_ticket_key:
-            continue # Already synced
 
-        try:
-            # Simple sync
-            issue = jira_service.create_issue(
-                summary=item.description[:255],
-                description=f"From Meeting: {meeting.title}\n\nOwner: {item.owner}\n\n{item.description}",
-                project_key=project_key,
-                issue_type="Task",
-                priority=item.priority or "Medium"
-            )
-            item.jira_ticket_key = issue['key']
-            item.jira_ticket_url = f"{settings.JIRA_BASE_URL}/browse/{issue['key']}"
-            created_ct += 1
-        except Exception as e:
-            print(f"Failed to sync item {item.id}: {e}")
+@app.get("/api/jobs/{job_id}")
+def get_job(job_id: int, db: Session = Depends(get_db)):
+    """Status and progress of a background job (e.g. a Jira sync)"""
+    job = job_queue.get(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
 
-    db.commit()
-    return {"success": True, "synced_count": created_ct}
+
+@app.get("/api/search", response_model=SearchResponse)
+def search_meetings(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """Full-text search over meeting titles, transcripts, summaries and action items"""
+    if not search_index:
+        raise HTTPException(status_code=503, detail="Search is not available")
+    return SearchResponse(query=q, results=search_index.search(db, q, limit=limit, offset=offset))
+
+
+@app.get("/api/llm/cache-stats")
+def llm_cache_stats():
+    """Hit/miss counters for the LLM result cache"""
+    if not llm_cache:
+        return {"enabled": False}
+    return {"enabled": True, **llm_cache.stats()}
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -239,10 +1091,12 @@ async def dashboard():
             <div class="row">
                 <div class="col-md-4">
                     <h3>Recent Meetings</h3>
+                    <input type="search" id="meetingSearch" class="form-control mb-2" placeholder="Search transcripts, summaries, action items..." oninput="onSearchInput()">
                     <div id="meetingList" class="list-group">
                         <!-- Meetings inserted here -->
                         <div class="text-center p-3 text-muted">Loading...</div>
                     </div>
+                    <button id="loadMoreMeetings" class="btn btn-outline-secondary w-100 mt-2 d-none" onclick="loadMeetings(true)">Load more</button>
                     <div class="mt-3 text-center">
                         <button class="btn btn-sm btn-outline-secondary" onclick="loadMeetings()">Refresh List</button>
                     </div>
@@ -258,9 +1112,12 @@ async def dashboard():
                         <h5>Action Items</h5>
                         <ul id="mActionItems" class="list-group mb-4"></ul>
 
+                        <audio id="mAudio" class="w-100 mb-3 d-none" controls preload="metadata"></audio>
+
                         <h5>Transcript</h5>
-                        <div style="max-height: 200px; overflow-y: auto; background: #eee; padding: 10px; border-radius: 5px;">
+                        <div id="mTranscriptBox" onscroll="onTranscriptScroll()" style="max-height: 200px; overflow-y: auto; background: #eee; padding: 10px; border-radius: 5px;">
                             <pre id="mTranscript" style="white-space: pre-wrap; font-size: 0.8em;"></pre>
+                            <button id="transcriptMore" class="btn btn-sm btn-outline-secondary d-none" onclick="loadTranscript()">Load more</button>
                         </div>
                         
                         <hr>
@@ -270,6 +1127,7 @@ async def dashboard():
                                 <input type="text" id="jiraProject" class="form-control" placeholder="Key (e.g. PROJ)">
                                 <button class="btn btn-primary" onclick="syncJira()">Sync Issues</button>
                             </div>
+                            <small id="jiraSyncStatus" class="text-muted"></small>
                         </div>
                     </div>
                 </div>
@@ -279,33 +1137,88 @@ async def dashboard():
         <script>
             let currentMeetingId = null;
 
-            async function loadMeetings() {
+            let meetingsCursor = null;
+
+            // Reloads the first page, or appends the next one when more is set
+            async function loadMeetings(more = false) {
                 try {
-                    const res = await fetch('/api/meetings');
-                    const meetings = await res.json();
+                    let url = '/api/meetings';
+                    if (more && meetingsCursor) url += `?cursor=${encodeURIComponent(meetingsCursor)}`;
+                    const res = await fetch(url);
+                    const page = await res.json();
+                    const meetings = page.items;
+                    meetingsCursor = page.next_cursor;
+
                     const list = document.getElementById('meetingList');
-                    list.innerHTML = '';
+                    if (!more) list.innerHTML = '';
+                    document.getElementById('loadMoreMeetings').classList.toggle('d-none', !meetingsCursor);
                     
-                    if (meetings.length === 0) {
+                    if (!more && meetings.length === 0) {
                         list.innerHTML = '<div class="list-group-item">No meetings found.</div>';
                         return;
                     }
 
-                    meetings.forEach(m => {
+                    meetings.forEach(m => list.appendChild(renderMeetingItem(m)));
+                } catch (e) {
+                    console.error("Failed to load meetings", e);
+                }
+            }
+
+            function renderMeetingItem(m) {
+                const item = document.createElement('a');
+                item.className = 'list-group-item list-group-item-action meeting-card';
+                item.dataset.meetingId = m.id;
+                item.innerHTML = `
+                    <div class="d-flex w-100 justify-content-between">
+                        <h5 class="mb-1">${m.title}</h5>
+                        <small>${new Date(m.timestamp).toLocaleDateString()}</small>
+                    </div>
+                    <p class="mb-1 meeting-status">Status: ${m.status}</p>
+                `;
+                item.onclick = () => loadDetail(m.id);
+                return item;
+            }
+
+            let searchTimer = null;
+
+            function onSearchInput() {
+                clearTimeout(searchTimer);
+                searchTimer = setTimeout(searchMeetings, 250);
+            }
+
+            async function searchMeetings() {
+                const q = document.getElementById('meetingSearch').value.trim();
+                if (!q) return loadMeetings();
+
+                try {
+                    const res = await fetch(`/api/search?q=${encodeURIComponent(q)}`);
+                    const data = await res.json();
+                    const list = document.getElementById('meetingList');
+                    list.innerHTML = '';
+                    document.getElementById('loadMoreMeetings').classList.add('d-none');
+
+                    if (!data.results || data.results.length === 0) {
+                        list.innerHTML = '<div class="list-group-item">No matching meetings.</div>';
+                        return;
+                    }
+
+                    data.results.forEach(r => {
                         const item = document.createElement('a');
                         item.className = 'list-group-item list-group-item-action meeting-card';
+                        item.dataset.meetingId = r.meeting_id;
+                        // snippet is HTML-escaped by the server, with matches in <mark>
                         item.innerHTML = `
                             <div class="d-flex w-100 justify-content-between">
-                                <h5 class="mb-1">${m.title}</h5>
-                                <small>${new Date(m.timestamp).toLocaleDateString()}</small>
+                                <h5 class="mb-1">${r.title}</h5>
+                                <small>${new Date(r.timestamp).toLocaleDateString()}</small>
                             </div>
-                            <p class="mb-1">Status: ${m.status}</p>
+                            <p class="mb-1 small">${r.snippet}</p>
                         `;
-                        item.onclick = () => loadDetail(m.id);
+                        item.onclick = () => loadDetail(r.meeting_id);
                         list.appendChild(item);
                     });
                 } catch (e) {
-                    console.error("Failed to load meetings", e);
+                    console.error("Search failed", e);
                 }
             }
 
@@ -313,13 +1226,27 @@ async def dashboard():
                 currentMeetingId = id;
                 document.getElementById('meetingDetail').classList.remove('d-none');
                 
-                const res = await fetch(`/api/meetings/${id}`);
+                // The transcript is paged separately; a long one would be megabytes here
+                const res = await fetch(`/api/meetings/${id}?include_transcript=false`);
                 const m = await res.json();
 
                 document.getElementById('mTitle').innerText = m.title;
                 document.getElementById('mStatus').innerText = m.status;
                 document.getElementById('mSummary').innerText = m.summary || "Pending...";
-                document.getElementById('mTranscript').innerText = m.transcript || "Pending...";
+                const audio = document.getElementById('mAudio');
+                if (m.audio_url) {
+                    // Only metadata is fetched up front; seeking requests byte ranges
+                    if (audio.getAttribute('src') !== m.audio_url) audio.src = m.audio_url;
+                    audio.classList.remove('d-none');
+                } else {
+                    audio.removeAttribute('src');
+                    audio.classList.add('d-none');
+                }
+                transcriptOffset = 0;
+                transcriptTotal = null;
+                document.getElementById('mTranscript').innerText = "";
+                document.getElementById('mTranscriptBox').scrollTop = 0;
+                loadTranscript();
 
                 const ul = document.getElementById('mActionItems');
                 ul.innerHTML = '';
@@ -347,6 +1274,61 @@ async def dashboard():
                 }
             }
 
+            let transcriptOffset = 0;
+            let transcriptTotal = null;
+            let transcriptLoading = false;
+
+            function formatTime(seconds) {
+                const s = Math.floor(seconds);
+                const hh = Math.floor(s / 3600), mm = Math.floor(s / 60) % 60, ss = s % 60;
+                const pad = n => String(n).padStart(2, '0');
+                return hh ? `${hh}:${pad(mm)}:${pad(ss)}` : `${pad(mm)}:${pad(ss)}`;
+            }
+
+            async function loadTranscript() {
+                const id = currentMeetingId;
+                if (transcriptLoading || (transcriptTotal !== null && transcriptOffset >= transcriptTotal)) return;
+                transcriptLoading = true;
+                try {
+                    const res = await fetch(`/api/meetings/${id}/transcript?offset=${transcriptOffset}`);
+                    if (id !== currentMeetingId) return; // Another meeting was opened meanwhile
+                    const page = await res.json();
+                    const pre = document.getElementById('mTranscript');
+                    if (page.total === 0) pre.innerText = "Pending...";
+                    page.segments.forEach(seg => {
+                        if (seg.index > 0) pre.appendChild(document.createTextNode(page.has_timings ? "\n" : " "));
+                        const span = document.createElement('span');
+                        if (seg.start !== null) {
+                            // Click a line to play the recording from there
+                            span.innerText = `[${formatTime(seg.start)}] ${seg.text}`;
+                            span.style.cursor = 'pointer';
+                            span.onclick = () => seekAudio(seg.start);
+                        } else {
+                            span.innerText = seg.text;
+                        }
+                        pre.appendChild(span);
+                    });
+                    transcriptOffset += page.segments.length;
+                    transcriptTotal = page.total;
+                    document.getElementById('transcriptMore').classList.toggle('d-none', transcriptOffset >= transcriptTotal);
+                } finally {
+                    transcriptLoading = false;
+                }
+            }
+
+            function seekAudio(seconds) {
+                const audio = document.getElementById('mAudio');
+                if (!audio.getAttribute('src')) return;
+                audio.currentTime = seconds;
+                audio.play();
+            }
+
+            function onTranscriptScroll() {
+                // Fetch the next page as the reader nears the end of what is loaded
+                const box = document.getElementById('mTranscriptBox');
+                if (box.scrollTop + box.clientHeight >= box.scrollHeight - 50) loadTranscript();
+            }
+
             async function syncJira() {
                 if (!currentMeetingId) return;
                 const projectKey = document.getElementById('jiraProject').value.trim();
@@ -355,26 +1337,90 @@ async def dashboard():
                 const formData = new FormData();
                 formData.append('project_key', projectKey);
 
+                const status = document.getElementById('jiraSyncStatus');
                 try {
                     const res = await fetch(`/api/meetings/${currentMeetingId}/sync-jira`, {
                         method: 'POST',
                         body: formData
                     });
                     const data = await res.json();
-                    if (data.success) {
-                        alert(`Synced ${data.synced_count} issues!`);
-                        loadDetail(currentMeetingId); // Refresh
-                    } else {
+                    if (!data.success) {
                         alert("Sync failed: " + (data.message || data.detail));
+                        return;
+                    }
+                    if (!data.job_id) {
+                        status.innerText = 'All action items are already in Jira.';
+                        return;
                     }
+                    // Progress arrives as jira_sync events
+                    status.innerText = 'Jira sync queued...';
                 } catch (e) {
                     alert("Error: " + e);
                 }
             }
 
+            // Live updates pushed by the server (no polling)
+            const STAGE_LABELS = {
+                recording: 'Recording',
+                uploaded: 'Queued',
+                transcribing: 'Transcribing',
+                extracting: 'Extracting action items',
+                completed: 'Completed',
+                error: 'Error'
+            };
+
+            function onMeetingEvent(e) {
+                const ev = JSON.parse(e.data);
+                const label = `Status: ${ev.status} (${STAGE_LABELS[ev.stage] || ev.stage})`;
+                const list = document.getElementById('meetingList');
+                const existing = list.querySelector(`[data-meeting-id="${ev.meeting_id}"] .meeting-status`);
+                const searching = document.getElementById('meetingSearch').value.trim();
+
+                if (existing) {
+                    existing.innerText = label;
+                } else if (!searching && (ev.stage === 'recording' || ev.stage === 'uploaded')) {
+                    // A new meeting; the list is newest first
+                    if (!list.querySelector('[data-meeting-id]')) list.innerHTML = '';
+                    const item = renderMeetingItem({ id: ev.meeting_id, title: ev.title, timestamp: ev.timestamp, status: ev.status });
+                    item.querySelector('.meeting-status').innerText = label;
+                    list.prepend(item);
+                }
+
+                if (currentMeetingId === ev.meeting_id) {
+                    document.getElementById('mStatus').innerText = ev.status;
+                    if (ev.stage === 'completed' || ev.stage === 'error') loadDetail(ev.meeting_id);
+                }
+            }
+
+            function onJiraSyncEvent(e) {
+                const ev = JSON.parse(e.data);
+                if (currentMeetingId !== ev.meeting_id) return;
+
+                const status = document.getElementById('jiraSyncStatus');
+                const p = ev.progress;
+                if (ev.error) {
+                    status.innerText = 'Jira sync failed: ' + ev.error;
+                } else if (p) {
+                    status.innerText = `Jira sync: ${p.created}/${p.total} created, ${p.failed} failed, ${p.pending} pending`;
+                }
+                if (ev.done) loadDetail(ev.meeting_id); // Show new ticket links
+            }
+
+            function connectEvents() {
+                const source = new EventSource('/api/events');
+                let dropped = false;
+                source.addEventListener('meeting', onMeetingEvent);
+                source.addEventListener('jira_sync', onJiraSyncEvent);
+                source.onerror = () => { dropped = true; };
+                source.onopen = () => {
+                    // The browser reconnects by itself; resync in case events were missed meanwhile
+                    if (dropped && !document.getElementById('meetingSearch').value.trim()) loadMeetings();
+                    dropped = false;
+                };
+            }
+
             loadMeetings();
-            // Refresh every 30s to check processing status
-            setInterval(loadMeetings, 30000);
+            connectEvents();
         </script>
     </body>
     </html>
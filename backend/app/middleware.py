@@ -0,0 +1,91 @@
+"""
+ASGI middleware
+"""
+from typing import Iterable
+
+from starlette.exceptions import HTTPException
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class _BodyTooLarge(HTTPException):
+    """HTTPException so FastAPI's body parsing re-raises it unchanged as a 413"""
+
+    def __init__(self, max_size: int):
+        super().__init__(status_code=413, detail=f"Upload exceeds maximum size of {max_size} bytes")
+
+
+class MaxBodySizeMiddleware:
+    """
+    Reject request bodies larger than max_size with 413.
+
+    Checks Content-Length up front and counts streamed bytes, so an oversized
+    upload is cut off as soon as it crosses the limit instead of after it has
+    been fully received and spooled. headroom bytes are allowed on top of
+    max_size for request framing (e.g. multipart boundaries and headers);
+    error messages report max_size.
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int, path_prefixes: Iterable[str] = ("/",), headroom: int = 0):
+        self.app = app
+        self.max_size = max_size
+        self.limit = max_size + headroom
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope.get("headers", []):
+            if name == b"content-length" and value.isdigit() and int(value) > self.limit:
+                await self._reject(scope, receive, send)
+                return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.limit:
+                    raise _BodyTooLarge(self.max_size)
+            return message
+
+        try:
+            await self.app(scope, limited_receive, send)
+        except _BodyTooLarge:
+            await self._reject(scope, receive, send)
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send) -> None:
+        response = JSONResponse(
+            status_code=413,
+            content={"detail": f"Upload exceeds maximum size of {self.max_size} bytes"}
+        )
+        await response(scope, receive, send)
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that leaves some paths alone.
+
+    Starlette's gzip responder buffers small chunks until it has a full
+    block, which would hold back Server-Sent Events indefinitely, and
+    re-compressing already-compressed audio only costs CPU (and would break
+    byte ranges, which refer to the uncompressed file).
+    """
+
+    def __init__(self, app: ASGIApp, exclude_prefixes: Iterable[str] = (), exclude_suffixes: Iterable[str] = (), **kwargs):
+        super().__init__(app, **kwargs)
+        self.exclude_prefixes = tuple(exclude_prefixes)
+        self.exclude_suffixes = tuple(exclude_suffixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and (
+            scope["path"].startswith(self.exclude_prefixes) or scope["path"].endswith(self.exclude_suffixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -1,7 +1,23 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+import zlib
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index, LargeBinary, event, inspect, text
+from sqlalchemy.orm import Session, relationship
 from datetime import datetime
-from app.database import Base
+from typing import Optional
+from app.database import Base, engine, SessionLocal
+from app.services.transcript_timeline import TranscriptTimeline
+
+
+def compress_text(value: Optional[str]) -> Optional[bytes]:
+    if value is None:
+        return None
+    return zlib.compress(value.encode("utf-8"), 6)
+
+
+def decompress_text(value: Optional[bytes]) -> Optional[str]:
+    if value is None:
+        return None
+    return zlib.decompress(value).decode("utf-8")
+
 
 class Meeting(Base):
     __tablename__ = "meetings"
@@ -10,17 +26,72 @@ class Meeting(Base):
     title = Column(String, default="Untitled Meeting")
     timestamp = Column(DateTime, default=datetime.utcnow)
     audio_path = Column(String, nullable=True)
-    transcript_text = Column(Text, nullable=True)
-    summary_text = Column(Text, nullable=True)
+    audio_hash = Column(String, nullable=True, index=True)  # SHA-256 of the uploaded audio
     status = Column(String, default="PROCESSING") # PROCESSING, COMPLETED, ERROR
+    # Bumped on every change to the meeting, its text or its action items (see _bump_meeting_versions)
+    version = Column(Integer, default=1)
+    updated_at = Column(DateTime, default=datetime.utcnow)
     
     action_items = relationship("ActionItem", back_populates="meeting")
+    # Large text lives in meeting_texts and is only loaded when accessed
+    text_store = relationship("MeetingText", uselist=False, lazy="select", cascade="all, delete-orphan", back_populates="meeting")
+
+    __table_args__ = (
+        # Keyset pagination of the meeting list: ORDER BY timestamp DESC, id DESC.
+        # Also serves any lookup by timestamp alone.
+        Index("ix_meetings_timestamp_id", "timestamp", "id"),
+        # Status-filtered listing in the same order; also serves lookups by status alone
+        Index("ix_meetings_status_timestamp_id", "status", "timestamp", "id"),
+    )
+
+    def _texts(self) -> "MeetingText":
+        if self.text_store is None:
+            self.text_store = MeetingText()
+        return self.text_store
+
+    @property
+    def transcript_text(self) -> Optional[str]:
+        return decompress_text(self.text_store.transcript) if self.text_store else None
+
+    @transcript_text.setter
+    def transcript_text(self, value: Optional[str]) -> None:
+        self._texts().transcript = compress_text(value)
+
+    @property
+    def summary_text(self) -> Optional[str]:
+        return decompress_text(self.text_store.summary) if self.text_store else None
+
+    @summary_text.setter
+    def summary_text(self, value: Optional[str]) -> None:
+        self._texts().summary = compress_text(value)
+
+    @property
+    def transcript_timeline(self) -> Optional[TranscriptTimeline]:
+        """Segment/word timings of the transcript, or None if none were stored"""
+        if self.text_store is None or self.text_store.timeline is None:
+            return None
+        return TranscriptTimeline.from_bytes(self.text_store.timeline)
+
+    @transcript_timeline.setter
+    def transcript_timeline(self, value: Optional[TranscriptTimeline]) -> None:
+        self._texts().timeline = value.to_bytes() if value is not None else None
+
+class MeetingText(Base):
+    """zlib-compressed transcript, summary and transcript timings, kept off the meetings table"""
+    __tablename__ = "meeting_texts"
+
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), primary_key=True)
+    transcript = Column(LargeBinary, nullable=True)
+    summary = Column(LargeBinary, nullable=True)
+    timeline = Column(LargeBinary, nullable=True)  # TranscriptTimeline.to_bytes()
+
+    meeting = relationship("Meeting", back_populates="text_store")
 
 class ActionItem(Base):
     __tablename__ = "action_items"
 
     id = Column(Integer, primary_key=True, index=True)
-    meeting_id = Column(Integer, ForeignKey("meetings.id"))
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), index=True)
     description = Column(String)
     owner = Column(String, nullable=True)
     priority = Column(String, default="Medium")
@@ -28,3 +99,102 @@ class ActionItem(Base):
     jira_ticket_url = Column(String, nullable=True)
     
     meeting = relationship("Meeting", back_populates="action_items")
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, index=True)
+    payload = Column(Text, default="{}")  # JSON-encoded handler kwargs
+    status = Column(String, default="PENDING", index=True) # PENDING, RUNNING, DONE, FAILED
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    last_error = Column(Text, nullable=True)
+    progress = Column(Text, nullable=True)  # JSON-encoded, written by the handler (see JobQueue.set_progress)
+    run_at = Column(DateTime, default=datetime.utcnow)
+    locked_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+class UploadSession(Base):
+    __tablename__ = "upload_sessions"
+
+    id = Column(String, primary_key=True, index=True)  # uuid hex, handed to the client
+    file_path = Column(String)
+    next_chunk = Column(Integer, default=0)  # index of the next chunk the server expects
+    bytes_received = Column(Integer, default=0)  # last acknowledged offset
+    status = Column(String, default="OPEN") # OPEN, FINALIZING, FINALIZED, EXPIRED
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+@event.listens_for(SessionLocal, "before_flush")
+def _bump_meeting_versions(session: Session, flush_context, instances) -> None:
+    """
+    Keep Meeting.version/updated_at current for conditional GETs.
+
+    A meeting counts as changed when its own row, its MeetingText or any of
+    its action items is modified, added or deleted in this flush.
+    """
+    meeting_ids = set()
+    for obj in list(session.dirty) + list(session.new) + list(session.deleted):
+        if isinstance(obj, Meeting):
+            if obj not in session.new and session.is_modified(obj, include_collections=False):
+                meeting_ids.add(obj.id)
+        elif isinstance(obj, (MeetingText, ActionItem)):
+            if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+                continue
+            meeting_id = obj.meeting_id
+            if meeting_id is None and obj.meeting is not None:
+                # Attached through the relationship; the foreign key is only set during the flush
+                meeting_id = obj.meeting.id
+            if meeting_id is not None:
+                meeting_ids.add(meeting_id)
+
+    now = datetime.utcnow()
+    for meeting_id in meeting_ids:
+        meeting = session.get(Meeting, meeting_id)
+        if meeting is None or meeting in session.new:
+            continue
+        meeting.version = (meeting.version or 0) + 1
+        meeting.updated_at = now
+
+
+def migrate_meeting_texts() -> int:
+    """
+    Move transcripts/summaries stored inline on meetings (the old
+    meetings.transcript_text / summary_text columns) into meeting_texts.
+
+    The old columns are emptied rather than dropped and the database is
+    vacuumed afterwards to give the space back. Returns the number of
+    meetings moved.
+    """
+    columns = {col["name"] for col in inspect(engine).get_columns("meetings")}
+    if "transcript_text" not in columns:
+        return 0
+
+    db = SessionLocal()
+    try:
+        rows = db.execute(text(
+            "SELECT id, transcript_text, summary_text FROM meetings "
+            "WHERE transcript_text IS NOT NULL OR summary_text IS NOT NULL"
+        )).all()
+        if not rows:
+            return 0
+
+        for meeting_id, transcript, summary in rows:
+            store = db.get(MeetingText, meeting_id) or MeetingText(meeting_id=meeting_id)
+            store.transcript = compress_text(transcript)
+            store.summary = compress_text(summary)
+            db.add(store)
+        db.execute(text("UPDATE meetings SET transcript_text = NULL, summary_text = NULL"))
+        db.commit()
+    finally:
+        db.close()
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("VACUUM")
+
+    print(f"Migrated: moved text of {len(rows)} meeting(s) to meeting_texts")
+    return len(rows)
@@ -0,0 +1,142 @@
+"""
+Custom responses
+"""
+import mimetypes
+import mmap
+import os
+import re
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+# Bytes per body message when the server cannot sendfile
+CHUNK_SIZE = 256 * 1024
+
+# mimetypes maps .webm to video/webm; these are audio-only recordings
+AUDIO_MEDIA_TYPES = {".webm": "audio/webm", ".ogg": "audio/ogg", ".wav": "audio/wav"}
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeFileResponse(Response):
+    """
+    Serve a file with HTTP Range support (RFC 9110 section 14).
+
+    A single "bytes=" range gets a 206 with Content-Range; an unsatisfiable
+    one a 416. Multiple ranges, or a Range whose If-Range validator no longer
+    matches, get the whole file with 200. The body is sent with the server's
+    zero-copy extension (sendfile) when available, otherwise in chunks sliced
+    from a memory map, so the file is never read into memory as a whole.
+    """
+
+    def __init__(self, path: str, request_headers: Headers, method: str = "GET", media_type: Optional[str] = None):
+        self.path = path
+        self.request_headers = request_headers
+        self.send_header_only = method.upper() == "HEAD"
+        self.stat_result = os.stat(path)
+        self.background = None
+
+        ext = os.path.splitext(path)[1].lower()
+        self.media_type = media_type or AUDIO_MEDIA_TYPES.get(ext) or mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+        size = self.stat_result.st_size
+        self.etag = f'"{self.stat_result.st_mtime_ns:x}-{size:x}"'
+        self.last_modified = formatdate(self.stat_result.st_mtime, usegmt=True)
+        self.range = self._parse_range(size)
+
+        self.status_code = 200
+        self.init_headers({
+            "Accept-Ranges": "bytes",
+            "ETag": self.etag,
+            "Last-Modified": self.last_modified,
+            "Cache-Control": "no-cache"
+        })
+        if self._not_modified():
+            self.status_code = 304
+            self.range = (0, -1)
+            del self.headers["content-type"]
+            return
+        if self.range is None:
+            self.status_code = 416
+            self.range = (0, -1)
+            self.headers["Content-Range"] = f"bytes */{size}"
+        elif self.range != (0, size - 1):
+            self.status_code = 206
+            self.headers["Content-Range"] = f"bytes {self.range[0]}-{self.range[1]}/{size}"
+        self.headers["Content-Length"] = str(self.range[1] - self.range[0] + 1)
+
+    def _parse_range(self, size: int) -> Optional[Tuple[int, int]]:
+        """
+        The inclusive (start, end) byte range to send: the whole file unless a
+        single satisfiable range applies, None if the range is unsatisfiable.
+        """
+        whole = (0, size - 1)
+        header = self.request_headers.get("range")
+        if not header or not self._if_range_matches():
+            return whole
+
+        match = _RANGE_RE.match(header.replace(" ", ""))
+        if not match or match.group(1) == match.group(2) == "":
+            # Multiple ranges or another unit: ignoring Range is allowed
+            return whole
+
+        first, last = match.groups()
+        if first == "":
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length == 0:
+                return None
+            return (max(0, size - length), size - 1) if size else None
+
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or start > end:
+            return None
+        return (start, end)
+
+    def _if_range_matches(self) -> bool:
+        if_range = self.request_headers.get("if-range")
+        if not if_range:
+            return True
+        if if_range.startswith(('"', "W/")):
+            # Strong comparison only
+            return if_range == self.etag
+        try:
+            return parsedate_to_datetime(if_range) >= parsedate_to_datetime(self.last_modified)
+        except (TypeError, ValueError):
+            return False
+
+    def _not_modified(self) -> bool:
+        if_none_match = self.request_headers.get("if-none-match")
+        if if_none_match is None:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or self.etag in tags
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+
+        start, end = self.range
+        count = end - start + 1
+        if self.send_header_only or count <= 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        with open(self.path, "rb") as file:
+            if "http.response.zerocopysend" in scope.get("extensions", {}):
+                await send({"type": "http.response.zerocopysend", "file": file, "offset": start, "count": count})
+                return
+
+            # mmap of an empty file fails, but count > 0 means the file is not empty
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                position = start
+                while position <= end:
+                    chunk_end = min(position + CHUNK_SIZE, end + 1)
+                    # Slicing may page the data in from disk; keep that off the event loop
+                    chunk = await anyio.to_thread.run_sync(lambda a=position, b=chunk_end: mapped[a:b])
+                    position = chunk_end
+                    await send({"type": "http.response.body", "body": chunk, "more_body": position <= end})
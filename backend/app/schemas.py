@@ -0,0 +1,61 @@
+"""
+API response models
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class MeetingListItem(BaseModel):
+    """One row of the meeting list - no transcript/summary"""
+    id: int
+    title: Optional[str] = None
+    timestamp: Optional[datetime] = None
+    status: Optional[str] = None
+
+
+class MeetingPage(BaseModel):
+    """A page of meetings, newest first"""
+    items: List[MeetingListItem]
+    # Pass back as ?cursor= to get the next page; None on the last page
+    next_cursor: Optional[str] = None
+
+
+class SearchResult(BaseModel):
+    """A meeting matching a search, with a highlighted excerpt"""
+    meeting_id: int
+    title: Optional[str] = None
+    timestamp: Optional[datetime] = None
+    status: Optional[str] = None
+    rank: float  # bm25 score; lower is a better match
+    snippet: str  # HTML-escaped, matches wrapped in <mark>
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchResult]
+
+
+class TranscriptWord(BaseModel):
+    start: Optional[float] = None  # seconds from the start of the recording
+    end: Optional[float] = None
+    text: str
+
+
+class TranscriptSegment(BaseModel):
+    index: int
+    start: Optional[float] = None  # None for transcripts stored without timings
+    end: Optional[float] = None
+    text: str
+    words: Optional[List[TranscriptWord]] = None  # only with ?words=true
+
+
+class TranscriptPage(BaseModel):
+    """A slice of a meeting's transcript segments"""
+    meeting_id: int
+    total: int  # number of segments in the whole transcript
+    offset: int
+    limit: int
+    has_timings: bool
+    segments: List[TranscriptSegment]
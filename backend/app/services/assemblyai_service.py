@@ -11,7 +11,8 @@ class AssemblyAIService:
     def transcribe(self, file_path: str) -> dict:
         """
         Transcribe audio file using AssemblyAI
-        Returns dict with 'text' key to match previous interface
+        Returns dict with 'text' key to match previous interface, plus
+        'words' ({start, end, text} with times in seconds)
         """
         try:
             transcript = self.transcriber.transcribe(file_path)
@@ -19,10 +20,17 @@ class AssemblyAIService:
             if transcript.status == aai.TranscriptStatus.error:
                 raise Exception(f"Transcription failed: {transcript.error}")
                 
+            # AssemblyAI reports milliseconds; the other services use seconds
+            words = [
+                {"start": word.start / 1000.0, "end": word.end / 1000.0, "text": word.text}
+                for word in (transcript.words or [])
+            ]
+
             return {
                 "text": transcript.text,
                 "id": transcript.id,
-                "status": transcript.status
+                "status": transcript.status,
+                "words": words
             }
         except Exception as e:
             print(f"AssemblyAI Error: {e}")
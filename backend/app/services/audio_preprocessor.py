@@ -0,0 +1,335 @@
+"""
+Audio pre-processing before transcription
+Decodes to 16 kHz mono, trims silence with an energy-based VAD and re-encodes
+compactly. Requires the ffmpeg binary and numpy; without them audio is passed
+through unchanged.
+"""
+import os
+import shutil
+import subprocess
+import threading
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from app.config import settings
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+FFMPEG_PATH = shutil.which("ffmpeg")
+
+# VAD frame length and how far above the estimated noise floor speech must be
+FRAME_MS = 30
+VAD_MARGIN_DB = 12.0
+VAD_MIN_DB = -50.0  # frames quieter than this are always silence
+SPEECH_PAD_S = 0.2  # context kept around every speech region
+
+
+@dataclass
+class PreprocessResult:
+    """Outcome of pre-processing one recording"""
+    path: str
+    original_bytes: int
+    processed_bytes: int
+    original_duration: float = 0.0
+    processed_duration: float = 0.0
+    # (processed_start_s, original_start_s, duration_s) for every kept region
+    regions: List[Tuple[float, float, float]] = field(default_factory=list)
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_bytes - self.processed_bytes
+
+    def to_original_time(self, t: float) -> float:
+        """Map a timestamp in the processed audio back to the original recording"""
+        for processed_start, original_start, duration in self.regions:
+            if t < processed_start + duration:
+                return original_start + max(0.0, t - processed_start)
+        if self.regions:
+            processed_start, original_start, duration = self.regions[-1]
+            return original_start + (t - processed_start)
+        return t
+
+
+class PCMStream:
+    """
+    Incremental decoder for a recording that arrives in pieces.
+
+    One ffmpeg process is fed the container bytes as they arrive and its PCM
+    output is collected by a reader thread, so every byte is decoded once.
+    Decoded audio is kept from `base` (a sample offset into the recording)
+    until the caller discards it.
+    """
+
+    def __init__(self, sample_rate: int):
+        self.sample_rate = sample_rate
+        self.base = 0  # recording offset of self._pcm[0], in samples
+        self._pcm = bytearray()
+        self._lock = threading.Lock()
+        self._proc = subprocess.Popen(
+            [
+                FFMPEG_PATH, "-nostdin", "-v", "error", "-i", "pipe:0",
+                "-ac", "1", "-ar", str(sample_rate), "-f", "s16le", "-"
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _read(self) -> None:
+        while True:
+            data = self._proc.stdout.read1(65536)
+            if not data:
+                return
+            with self._lock:
+                self._pcm.extend(data)
+
+    def feed(self, data: bytes) -> None:
+        """Pass the next bytes of the recording to the decoder. Blocking."""
+        self._proc.stdin.write(data)
+        self._proc.stdin.flush()
+
+    def finish(self, timeout: float = 60.0) -> None:
+        """Signal end of input and wait until everything is decoded"""
+        if not self._proc.stdin.closed:
+            self._proc.stdin.close()
+        self._proc.wait(timeout=timeout)
+        self._reader.join(timeout=timeout)
+
+    def close(self) -> None:
+        """Stop the decoder without waiting for pending output"""
+        if self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+        if not self._proc.stdin.closed:
+            self._proc.stdin.close()
+
+    @property
+    def decoded_until(self) -> int:
+        """Recording offset (in samples) up to which audio has been decoded"""
+        with self._lock:
+            return self.base + len(self._pcm) // 2
+
+    def samples(self) -> "np.ndarray":
+        """Decoded audio from self.base onwards, as a copy"""
+        with self._lock:
+            return np.frombuffer(bytes(self._pcm[:len(self._pcm) // 2 * 2]), dtype=np.int16)
+
+    def discard_before(self, offset: int) -> None:
+        """Drop decoded audio before recording sample offset, e.g. once it is transcribed"""
+        with self._lock:
+            drop = min(max(0, offset - self.base), len(self._pcm) // 2)
+            del self._pcm[:drop * 2]
+            self.base += drop
+
+
+class AudioPreprocessor:
+    """Decode, downmix, resample, trim silence and re-encode recordings"""
+
+    def __init__(self, sample_rate: int = 16000, max_silence: float = 1.0, bitrate: str = "24k"):
+        if not FFMPEG_PATH:
+            raise ValueError("ffmpeg not found on PATH")
+        if not NUMPY_AVAILABLE:
+            raise ValueError("numpy not installed. Install with: pip install numpy")
+
+        self.sample_rate = sample_rate
+        self.max_silence = max_silence
+        self.bitrate = bitrate
+
+    def preprocess(self, audio_path: str) -> PreprocessResult:
+        """
+        Produce a compact, silence-trimmed 16 kHz mono copy of audio_path.
+
+        Returns a result pointing at the original file if decoding fails or
+        nothing would be saved.
+        """
+        original_bytes = os.path.getsize(audio_path)
+        passthrough = PreprocessResult(path=audio_path, original_bytes=original_bytes, processed_bytes=original_bytes)
+
+        try:
+            samples = self.decode(audio_path)
+        except Exception as e:
+            print(f"Audio decode failed, using original file: {e}")
+            return passthrough
+
+        if samples.size == 0:
+            return passthrough
+
+        regions = self.speech_regions(samples)
+        if not regions:
+            # Nothing above the noise floor - keep everything rather than send empty audio
+            regions = [(0, samples.size)]
+
+        trimmed = np.concatenate([samples[start:end] for start, end in regions])
+
+        out_path = f"{os.path.splitext(audio_path)[0]}.16k.ogg"
+        try:
+            self.encode(trimmed, out_path)
+        except Exception as e:
+            print(f"Audio encode failed, using original file: {e}")
+            return passthrough
+
+        processed_bytes = os.path.getsize(out_path)
+        if processed_bytes >= original_bytes:
+            os.remove(out_path)
+            return passthrough
+
+        time_map = []
+        processed_start = 0
+        for start, end in regions:
+            time_map.append((processed_start / self.sample_rate, start / self.sample_rate, (end - start) / self.sample_rate))
+            processed_start += end - start
+
+        return PreprocessResult(
+            path=out_path,
+            original_bytes=original_bytes,
+            processed_bytes=processed_bytes,
+            original_duration=samples.size / self.sample_rate,
+            processed_duration=trimmed.size / self.sample_rate,
+            regions=time_map
+        )
+
+    def open_stream(self) -> PCMStream:
+        """Incremental decoder producing the same PCM format as decode()"""
+        return PCMStream(self.sample_rate)
+
+    def decode(self, audio_path: str) -> "np.ndarray":
+        """Decode any ffmpeg-readable file to mono int16 PCM at self.sample_rate"""
+        proc = subprocess.run(
+            [
+                FFMPEG_PATH, "-nostdin", "-v", "error", "-i", audio_path,
+                "-ac", "1", "-ar", str(self.sample_rate), "-f", "s16le", "-"
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True
+        )
+        return np.frombuffer(proc.stdout, dtype=np.int16)
+
+    def encode(self, samples: "np.ndarray", out_path: str) -> None:
+        """Encode mono int16 PCM to Ogg/Opus, falling back to FLAC inside Ogg"""
+        base_cmd = [
+            FFMPEG_PATH, "-nostdin", "-v", "error", "-y",
+            "-f", "s16le", "-ac", "1", "-ar", str(self.sample_rate), "-i", "-"
+        ]
+        pcm = samples.astype(np.int16).tobytes()
+        try:
+            subprocess.run(
+                base_cmd + ["-c:a", "libopus", "-b:a", self.bitrate, "-application", "voip", out_path],
+                input=pcm, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+            )
+        except subprocess.CalledProcessError:
+            # ffmpeg built without libopus
+            subprocess.run(
+                base_cmd + ["-c:a", "flac", out_path],
+                input=pcm, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+            )
+
+    def split_points(self, samples: "np.ndarray", segment_seconds: float) -> List[int]:
+        """
+        Choose sample offsets to cut audio into pieces of about segment_seconds.
+
+        Each cut lands on the quietest frame within +/-20% of the target
+        position, so words are not split across pieces.
+        """
+        frame_len = int(self.sample_rate * FRAME_MS / 1000)
+        n_frames = samples.size // frame_len
+        target = int(segment_seconds * 1000 / FRAME_MS)
+        if n_frames == 0 or target <= 0 or n_frames <= target * 1.5:
+            return []
+
+        frames = samples[:n_frames * frame_len].astype(np.float32).reshape(n_frames, frame_len)
+        energy = np.mean(frames * frames, axis=1)
+
+        window = max(1, target // 5)
+        cuts = []
+        position = 0
+        while n_frames - position > target * 1.5:
+            lo = position + target - window
+            hi = min(position + target + window, n_frames)
+            cut = lo + int(np.argmin(energy[lo:hi]))
+            cuts.append(cut * frame_len)
+            position = cut
+        return cuts
+
+    def quietest_point(self, samples: "np.ndarray", lo: int, hi: int) -> int:
+        """Sample offset of the quietest frame between samples lo and hi"""
+        frame_len = int(self.sample_rate * FRAME_MS / 1000)
+        lo = max(0, lo)
+        n_frames = (min(hi, samples.size) - lo) // frame_len
+        if n_frames <= 0:
+            return min(hi, samples.size)
+
+        frames = samples[lo:lo + n_frames * frame_len].astype(np.float32).reshape(n_frames, frame_len)
+        return lo + int(np.argmin(np.mean(frames * frames, axis=1))) * frame_len
+
+    def speech_regions(self, samples: "np.ndarray") -> List[Tuple[int, int]]:
+        """
+        Find sample ranges to keep.
+
+        Frames are classified by RMS energy against an adaptive threshold
+        (noise floor + VAD_MARGIN_DB), padded by SPEECH_PAD_S, and gaps longer
+        than self.max_silence are cut down to max_silence.
+        """
+        frame_len = int(self.sample_rate * FRAME_MS / 1000)
+        n_frames = samples.size // frame_len
+        if n_frames == 0:
+            return [(0, samples.size)]
+
+        frames = samples[:n_frames * frame_len].astype(np.float32).reshape(n_frames, frame_len) / 32768.0
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+        noise_floor = np.percentile(db, 10)
+        threshold = max(noise_floor + VAD_MARGIN_DB, VAD_MIN_DB)
+        speech = db > threshold
+
+        # Dilate the speech mask so word onsets/tails are not clipped
+        pad = int(round(SPEECH_PAD_S * 1000 / FRAME_MS))
+        if pad:
+            speech = np.convolve(speech.astype(np.int32), np.ones(2 * pad + 1, dtype=np.int32), mode="same") > 0
+
+        # Run boundaries: +1 where speech starts, -1 where it ends
+        edges = np.diff(np.concatenate(([0], speech.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        if starts.size == 0:
+            return []
+
+        # Shorten internal silences longer than max_silence, splitting the kept gap across both sides
+        max_gap = int(round(self.max_silence * 1000 / FRAME_MS))
+        regions = []
+        cur_start, cur_end = starts[0], ends[0]
+        for start, end in zip(starts[1:], ends[1:]):
+            if start - cur_end <= max_gap:
+                cur_end = end
+            else:
+                half = max_gap // 2
+                regions.append((cur_start, cur_end + half))
+                cur_start, cur_end = start - (max_gap - half), end
+        regions.append((cur_start, cur_end))
+
+        last_sample = samples.size
+        return [
+            (int(start) * frame_len, min(int(end) * frame_len, last_sample) if end < n_frames else last_sample)
+            for start, end in regions
+        ]
+
+
+# Singleton
+audio_preprocessor = None
+if settings.AUDIO_PREPROCESSING_ENABLED:
+    try:
+        audio_preprocessor = AudioPreprocessor(
+            sample_rate=settings.AUDIO_SAMPLE_RATE,
+            max_silence=settings.AUDIO_MAX_SILENCE,
+            bitrate=settings.AUDIO_BITRATE
+        )
+    except Exception as e:
+        print(f"Warning: Audio pre-processing disabled: {e}")
@@ -0,0 +1,91 @@
+"""
+In-process event bus for Server-Sent Events
+Job workers and request handlers publish small JSON events; every open
+/api/events stream receives them. Publishing is thread-safe and never blocks.
+"""
+import asyncio
+import itertools
+import json
+import threading
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+# Events kept for clients reconnecting with Last-Event-ID
+REPLAY_SIZE = 200
+# Per-subscriber buffer; a client that falls this far behind loses the oldest events
+SUBSCRIBER_QUEUE_SIZE = 500
+# Comment line sent when idle so proxies keep the connection open
+HEARTBEAT_SECONDS = 15.0
+
+
+class EventBus:
+    """Fan-out of events to asyncio subscribers, fed from any thread"""
+
+    def __init__(self, replay_size: int = REPLAY_SIZE):
+        self._ids = itertools.count(1)
+        self._recent: Deque[Tuple[int, str, Dict[str, Any]]] = deque(maxlen=replay_size)
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._lock = threading.Lock()
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Send an event to all current subscribers. Safe to call from worker threads."""
+        with self._lock:
+            event = (next(self._ids), event_type, data)
+            self._recent.append(event)
+            subscribers = list(self._subscribers)
+
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, event)
+            except RuntimeError:
+                # Loop already closed; the subscriber is going away
+                pass
+
+    @staticmethod
+    def _deliver(queue: asyncio.Queue, event: Tuple[int, str, Dict[str, Any]]) -> None:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+    async def stream(self, last_event_id: Optional[int] = None) -> AsyncIterator[str]:
+        """
+        Yield SSE-formatted events until the client goes away.
+
+        Events newer than last_event_id that are still in the replay buffer
+        are sent first.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            missed = [e for e in self._recent if last_event_id is not None and e[0] > last_event_id]
+            self._subscribers.append(subscriber)
+
+        try:
+            # Tell the browser how long to wait before reconnecting
+            yield "retry: 3000\n\n"
+            for event in missed:
+                yield self.format(event)
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield self.format(event)
+        finally:
+            with self._lock:
+                self._subscribers.remove(subscriber)
+
+    @staticmethod
+    def format(event: Tuple[int, str, Dict[str, Any]]) -> str:
+        event_id, event_type, data = event
+        return f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(data, default=str)}\n\n"
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+
+# Singleton
+event_bus = EventBus()
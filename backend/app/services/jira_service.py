@@ -1,12 +1,222 @@
 """
 Jira API integration service
 """
+import hashlib
+import random
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from app.config import settings
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 
+# One pooled keep-alive session per (Jira site, credential), shared by every JiraService
+_sessions: Dict[Tuple[str, str, str], requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+# Shared by every JiraService so concurrency limits hold across requests
+_jira_executor = ThreadPoolExecutor(max_workers=settings.JIRA_MAX_CONCURRENCY, thread_name_prefix="jira")
+
+# Statuses meaning "not processed, try again later"
+RETRY_STATUSES = (429, 503)
+
+# Per-endpoint caps on in-flight requests; anything else uses JIRA_ENDPOINT_CONCURRENCY.
+# Bulk creates are heavy on Jira's side and count against a stricter limit.
+ENDPOINT_CONCURRENCY = {"issue/bulk": 2}
+
+
+class JiraRateLimitError(RuntimeError):
+    """Jira kept rate limiting a request after all retries"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _RateLimiter:
+    """
+    Token bucket shared by all requests to one Jira site.
+
+    The refill rate adapts: it is halved whenever Jira answers 429 and creeps
+    back up towards JIRA_RATE_LIMIT on success, so throughput settles near the
+    highest rate the site accepts. A Retry-After pauses the whole bucket.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def throttled(self, retry_after: Optional[float]) -> None:
+        """Record a 429: slow down, and stop sending for retry_after seconds"""
+        with self._lock:
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+            self.tokens = 0.0
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+
+    def succeeded(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+_MISSING = object()
+
+
+class _TTLCache:
+    """Thread-safe dict whose entries expire; None is a valid (cached) value"""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._data: Dict[Any, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Cached value, or _MISSING if absent or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            value, expires = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return _MISSING
+            return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (value, time.monotonic() + ttl)
+            if len(self._data) > self.max_entries:
+                now = time.monotonic()
+                for k in [k for k, (_, expires) in self._data.items() if expires < now]:
+                    del self._data[k]
+                # Still full: drop the oldest insertions
+                while len(self._data) > self.max_entries:
+                    del self._data[next(iter(self._data))]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# owner query -> accountId (or None when Jira has no match), per site and project
+_user_cache = _TTLCache()
+
+# (site, project key) -> creatable issue types and priorities, see get_project_metadata
+_metadata_cache = _TTLCache(max_entries=100)
+
+# Common priority words (e.g. from LLM output) for Jira's default scheme
+PRIORITY_ALIASES = {
+    "critical": "Highest",
+    "urgent": "Highest",
+    "blocker": "Highest",
+    "major": "High",
+    "normal": "Medium",
+    "minor": "Low",
+    "trivial": "Lowest",
+}
+
+_limiters: Dict[str, _RateLimiter] = {}
+_endpoint_slots: Dict[Tuple[str, str], threading.BoundedSemaphore] = {}
+_limits_lock = threading.Lock()
+
+
+def get_rate_limiter(base_url: str) -> _RateLimiter:
+    """Return the token bucket for a Jira site"""
+    site = base_url.rstrip('/')
+    with _limits_lock:
+        limiter = _limiters.get(site)
+        if limiter is None:
+            limiter = _RateLimiter(settings.JIRA_RATE_LIMIT, settings.JIRA_RATE_BURST)
+            _limiters[site] = limiter
+        return limiter
+
+
+def _endpoint_slot(base_url: str, endpoint: str) -> threading.BoundedSemaphore:
+    key = (base_url.rstrip('/'), endpoint)
+    with _limits_lock:
+        slot = _endpoint_slots.get(key)
+        if slot is None:
+            slot = threading.BoundedSemaphore(ENDPOINT_CONCURRENCY.get(endpoint, settings.JIRA_ENDPOINT_CONCURRENCY))
+            _endpoint_slots[key] = slot
+        return slot
+
+
+def _endpoint_name(path: str) -> str:
+    """Group an API path for concurrency caps: /rest/api/3/issue/ABC-1 -> "issue" """
+    parts = path.split("/rest/api/3/", 1)[-1].strip("/").split("/")
+    if parts[:2] == ["issue", "bulk"]:
+        return "issue/bulk"
+    return parts[0]
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Parse Retry-After (seconds or HTTP date)"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def get_jira_session(base_url: str, email: str, api_token: str) -> requests.Session:
+    """
+    Return the shared requests.Session for a Jira site and credential.
+
+    Connections are kept alive and pooled (JIRA_POOL_MAXSIZE per host), so
+    consecutive calls reuse TCP/TLS connections instead of handshaking again.
+    """
+    # Key on a digest so raw tokens are not kept as dict keys
+    token_digest = hashlib.sha256(api_token.encode("utf-8")).hexdigest()
+    key = (base_url.rstrip('/'), email, token_digest)
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            session.auth = HTTPBasicAuth(email, api_token)
+            session.headers.update({"Accept": "application/json"})
+            adapter = HTTPAdapter(
+                pool_connections=settings.JIRA_POOL_CONNECTIONS,
+                pool_maxsize=settings.JIRA_POOL_MAXSIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[key] = session
+        return session
+
+
 class JiraService:
     """Service for integrating with Jira API"""
     
@@ -17,6 +227,55 @@ class JiraService:
         
         if not all([self.base_url, self.email, self.api_token]):
             raise ValueError("Jira credentials not configured")
+
+        self.session = get_jira_session(self.base_url, self.email, self.api_token)
+        self.limiter = get_rate_limiter(self.base_url)
+        self.timeout = (settings.JIRA_CONNECT_TIMEOUT, settings.JIRA_READ_TIMEOUT)
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the site's rate limiter.
+
+        429/503 responses are retried after Retry-After if given, otherwise
+        with jittered exponential backoff. Connection errors are retried for
+        GETs only. Other responses are returned as-is for the caller to check.
+
+        Raises:
+            JiraRateLimitError: still throttled after JIRA_MAX_RETRIES retries
+        """
+        url = f"{self.base_url.rstrip('/')}{path}"
+        kwargs.setdefault("timeout", self.timeout)
+        slot = _endpoint_slot(self.base_url, _endpoint_name(path))
+
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            try:
+                with slot:
+                    response = self.session.request(method, url, **kwargs)
+            except requests.ConnectionError:
+                if method != "GET" or attempt >= settings.JIRA_MAX_RETRIES:
+                    raise
+                retry_after = None
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    self.limiter.succeeded()
+                    return response
+                retry_after = _retry_after_seconds(response)
+                self.limiter.throttled(retry_after)
+                if attempt >= settings.JIRA_MAX_RETRIES:
+                    raise JiraRateLimitError(
+                        f"Jira API error {response.status_code}: rate limited on {method} {path} "
+                        f"after {attempt + 1} attempts",
+                        retry_after=retry_after
+                    )
+
+            # Full jitter: sleep a random fraction of the capped exponential delay
+            backoff = min(settings.JIRA_RETRY_MAX_DELAY, settings.JIRA_RETRY_BACKOFF * 2 ** attempt)
+            delay = retry_after if retry_after is not None else random.uniform(0, backoff)
+            attempt += 1
+            print(f"Jira {method} {path} throttled, retry {attempt}/{settings.JIRA_MAX_RETRIES} in {delay:.1f}s")
+            time.sleep(delay)
     
     def create_issue(
         self,
@@ -45,39 +304,27 @@ class JiraService:
         """
         if not project_key:
             raise ValueError("project_key is required")
-        
-        url = f"{self.base_url.rstrip('/')}/rest/api/3/issue"
-        
+
+        # Fails before the create request if the project/type is wrong
+        issue_type, priority = self.normalize_issue_fields(project_key, issue_type, priority)
+
         payload = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": summary,
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": description}]
-                        }
-                    ]
-                },
-                "issuetype": {"name": issue_type},
-                "priority": {"name": priority}
-            }
+            "fields": self.build_issue_fields(
+                summary=summary,
+                description=description,
+                issue_type=issue_type,
+                project_key=project_key,
+                priority=priority,
+                assignee=assignee,
+                due_date=due_date
+            )
         }
         
-        if assignee:
-            payload["fields"]["assignee"] = {"accountId": assignee}
-        
-        if due_date:
-            payload["fields"]["duedate"] = due_date
-        
-        response = requests.post(
-            url,
+        response = self._request(
+            "POST",
+            "/rest/api/3/issue",
             json=payload,
-            auth=HTTPBasicAuth(self.email, self.api_token),
-            headers={"Accept": "application/json", "Content-Type": "application/json"}
+            headers={"Content-Type": "application/json"}
         )
 
         try:
@@ -93,15 +340,121 @@ class JiraService:
 
         return response.json()
     
+    def build_issue_fields(
+        self,
+        summary: str,
+        description: str,
+        issue_type: str = "Task",
+        project_key: str = None,
+        priority: str = "Medium",
+        assignee: Optional[str] = None,
+        due_date: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the "fields" object for an issue create request (see create_issue)"""
+        if not project_key:
+            raise ValueError("project_key is required")
+
+        fields = {
+            "project": {"key": project_key},
+            "summary": summary,
+            "description": {
+                "type": "doc",
+                "version": 1,
+                "content": [
+                    {
+                        "type": "paragraph",
+                        "content": [{"type": "text", "text": description}]
+                    }
+                ]
+            },
+            "issuetype": {"name": issue_type}
+        }
+
+        if priority:
+            fields["priority"] = {"name": priority}
+
+        if assignee:
+            fields["assignee"] = {"accountId": assignee}
+
+        if due_date:
+            fields["duedate"] = due_date
+
+        return fields
+
+    def create_issues_bulk(
+        self,
+        issues: List[Dict[str, Any]],
+        on_batch: Optional[Callable[[int, List[Dict[str, Any]]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many issues with Jira's bulk endpoint.
+
+        Args:
+            issues: "fields" objects as returned by build_issue_fields
+            on_batch: called in the caller's thread as each batch finishes, with
+                the index of the batch's first issue and that batch's results
+
+        Returns:
+            One result per input, in order: the created issue ({"id", "key", ...})
+            or {"error": message} if that issue could not be created.
+        """
+        batch_size = settings.JIRA_BULK_BATCH_SIZE
+        results: List[Dict[str, Any]] = [{} for _ in issues]
+
+        # Batches go out concurrently; the limiter and endpoint cap keep this within Jira's limits
+        futures = {
+            _jira_executor.submit(self._create_issues_batch, issues[start:start + batch_size]): start
+            for start in range(0, len(issues), batch_size)
+        }
+        for future in as_completed(futures):
+            start = futures[future]
+            batch_results = future.result()
+            results[start:start + len(batch_results)] = batch_results
+            if on_batch:
+                on_batch(start, batch_results)
+        return results
+
+    def _create_issues_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """One bulk create request (at most JIRA_BULK_BATCH_SIZE issues)"""
+        try:
+            response = self._request(
+                "POST",
+                "/rest/api/3/issue/bulk",
+                json={"issueUpdates": [{"fields": fields} for fields in batch]},
+                headers={"Content-Type": "application/json"}
+            )
+            body = response.json()
+        except Exception as e:
+            return [{"error": str(e)} for _ in batch]
+
+        # 201 = at least one created; 400 with "errors" = every item failed.
+        # Anything else is a whole-batch failure.
+        parsed = isinstance(body, dict) and ("issues" in body or "errors" in body)
+        if response.status_code not in (200, 201, 400) or not parsed:
+            error = f"Jira API error {response.status_code}: {body}"
+            return [{"error": error} for _ in batch]
+
+        failed = {}
+        for err in body.get("errors", []):
+            element_errors = err.get("elementErrors", {})
+            failed[err.get("failedElementNumber")] = (
+                f"Jira API error {err.get('status')}: "
+                f"{element_errors.get('errors') or element_errors.get('errorMessages') or element_errors}"
+            )
+
+        # Created issues come back in request order, skipping failed elements
+        created = iter(body.get("issues", []))
+        results = []
+        for i in range(len(batch)):
+            if i in failed:
+                results.append({"error": failed[i]})
+            else:
+                results.append(next(created, {"error": "Missing from Jira bulk response"}))
+        return results
+
     def get_issue(self, issue_key: str) -> Dict[str, Any]:
         """Get issue details"""
-        url = f"{self.base_url.rstrip('/')}/rest/api/3/issue/{issue_key}"
-        
-        response = requests.get(
-            url,
-            auth=HTTPBasicAuth(self.email, self.api_token),
-            headers={"Accept": "application/json"}
-        )
+        response = self._request("GET", f"/rest/api/3/issue/{issue_key}")
         
         response.raise_for_status()
         return response.json()
@@ -110,13 +463,7 @@ class JiraService:
         """
         Get project details by key. Raises RuntimeError with Jira body on failure.
         """
-        url = f"{self.base_url.rstrip('/')}/rest/api/3/project/{project_key}"
-
-        response = requests.get(
-            url,
-            auth=HTTPBasicAuth(self.email, self.api_token),
-            headers={"Accept": "application/json"}
-        )
+        response = self._request("GET", f"/rest/api/3/project/{project_key}")
 
         try:
             response.raise_for_status()
@@ -130,74 +477,185 @@ class JiraService:
 
         return response.json()
 
+    def get_project_metadata(self, project_key: str) -> Dict[str, Any]:
+        """
+        Issue types and priorities usable for creating issues in a project.
+
+        Built from get_project, the createmeta issue types endpoint and the
+        priority list, and cached per site for JIRA_METADATA_TTL seconds.
+
+        Returns:
+            {"key", "id", "issue_types": {lowercase: name}, "priorities": {lowercase: name}}
+
+        Raises:
+            ValueError: the project does not exist or is not visible
+        """
+        cache_key = (self.base_url.rstrip('/'), project_key.upper())
+        cached = _metadata_cache.get(cache_key)
+        if cached is not _MISSING:
+            return cached
+
+        try:
+            project = self.get_project(project_key)
+        except RuntimeError as e:
+            if " 404" in str(e):
+                raise ValueError(f"Jira project '{project_key}' not found") from e
+            raise
+
+        # Creatable types; the project's own list is a fallback for servers without createmeta/{project}
+        issue_types = project.get("issueTypes") or []
+        response = self._request("GET", f"/rest/api/3/issue/createmeta/{project['key']}/issuetypes")
+        if response.status_code == 200:
+            body = response.json()
+            issue_types = body.get("issueTypes") or body.get("values") or issue_types
+
+        response = self._request("GET", "/rest/api/3/priority")
+        response.raise_for_status()
+        priorities = response.json()
+
+        metadata = {
+            "key": project["key"],
+            "id": project.get("id"),
+            "issue_types": {t["name"].casefold(): t["name"] for t in issue_types if t.get("name")},
+            "priorities": {p["name"].casefold(): p["name"] for p in priorities if p.get("name")}
+        }
+        _metadata_cache.set(cache_key, metadata, settings.JIRA_METADATA_TTL)
+        return metadata
+
+    def normalize_issue_fields(self, project_key: str, issue_type: str, priority: Optional[str]) -> Tuple[str, Optional[str]]:
+        """
+        Check an issue type and priority against the project's metadata.
+
+        Matching ignores case, and common priority words ("critical",
+        "normal", ...) are mapped onto Jira's names. An unknown priority
+        falls back to Medium when the site has it, otherwise it is dropped
+        so Jira applies its default.
+
+        Returns:
+            (issue_type, priority) spelled as Jira expects
+
+        Raises:
+            ValueError: unknown project or issue type
+        """
+        metadata = self.get_project_metadata(project_key)
+
+        canonical_type = metadata["issue_types"].get(issue_type.strip().casefold())
+        if not canonical_type:
+            valid = ", ".join(sorted(metadata["issue_types"].values()))
+            raise ValueError(f"Issue type '{issue_type}' is not available in project {metadata['key']} (valid: {valid})")
+
+        priorities = metadata["priorities"]
+        canonical_priority = None
+        if priority:
+            wanted = priority.strip().casefold()
+            canonical_priority = priorities.get(wanted) or priorities.get(PRIORITY_ALIASES.get(wanted, "").casefold())
+        if not canonical_priority:
+            canonical_priority = priorities.get("medium")
+
+        return canonical_type, canonical_priority
+
     def find_user(self, query: str, project_key: Optional[str] = None) -> Optional[str]:
         """
         Try to find a Jira user accountId given a query (email or display name fragment).
 
         Strategy:
-        - If project_key provided, try assignable search first (ensures user can be assigned in project).
-        - Fall back to global user search endpoint.
+        - If project_key provided, only the assignable search is used, so the
+          result can always be set as the assignee of an issue in that project.
+        - Otherwise, the global user search endpoint.
+
+        Results, including "no such user", are cached per site for
+        JIRA_USER_CACHE_TTL / JIRA_USER_NEGATIVE_TTL seconds. Failed lookups
+        are not cached.
 
         Returns accountId string if found, otherwise None.
         """
-        if not query:
+        if not query or not query.strip():
             return None
 
-        # Try assignable search if project provided
-        try:
-            if project_key:
-                url = f"{self.base_url.rstrip('/')}/rest/api/3/user/assignable/search"
-                params = {"project": project_key, "query": query}
-                response = requests.get(
-                    url,
-                    params=params,
-                    auth=HTTPBasicAuth(self.email, self.api_token),
-                    headers={"Accept": "application/json"}
-                )
-
-                if response.status_code == 200:
-                    try:
-                        users = response.json()
-                        if users:
-                            return users[0].get("accountId")
-                    except Exception:
-                        pass
-
-            # Fallback to global user search
-            url = f"{self.base_url.rstrip('/')}/rest/api/3/user/search"
-            params = {"query": query}
-            response = requests.get(
-                url,
-                params=params,
-                auth=HTTPBasicAuth(self.email, self.api_token),
-                headers={"Accept": "application/json"}
-            )
-
-            if response.status_code == 200:
-                try:
-                    users = response.json()
-                    if users:
-                        return users[0].get("accountId")
-                except Exception:
-                    pass
+        key = self._user_cache_key(query, project_key)
+        cached = _user_cache.get(key)
+        if cached is not _MISSING:
+            return cached
 
+        try:
+            account_id, definitive = self._search_user(query.strip(), project_key)
         except Exception:
             # Swallow network/permissions errors and return None - caller will skip assignee
             return None
 
-        return None
+        if account_id:
+            _user_cache.set(key, account_id, settings.JIRA_USER_CACHE_TTL)
+        elif definitive:
+            _user_cache.set(key, None, settings.JIRA_USER_NEGATIVE_TTL)
+        return account_id
+
+    def resolve_account_ids(self, owners: List[Optional[str]], project_key: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """
+        Resolve many owner names to accountIds at once.
+
+        Owners are de-duplicated (case-insensitively), served from the cache
+        where possible and the rest looked up concurrently.
+
+        Returns:
+            {owner: accountId or None} for every non-empty owner given
+        """
+        unique: Dict[Tuple[str, str, str], str] = {}
+        for owner in owners:
+            if owner and owner.strip():
+                unique.setdefault(self._user_cache_key(owner, project_key), owner)
+
+        resolved = {}
+        to_lookup = []
+        for key, owner in unique.items():
+            cached = _user_cache.get(key)
+            if cached is _MISSING:
+                to_lookup.append(owner)
+            else:
+                resolved[key] = cached
+
+        if to_lookup:
+            print(f"Resolving {len(to_lookup)} Jira user(s) ({len(unique) - len(to_lookup)} cached)")
+            for owner, account_id in zip(to_lookup, _jira_executor.map(lambda o: self.find_user(o, project_key), to_lookup)):
+                resolved[self._user_cache_key(owner, project_key)] = account_id
+
+        return {
+            owner: resolved[self._user_cache_key(owner, project_key)]
+            for owner in owners
+            if owner and owner.strip()
+        }
+
+    def _user_cache_key(self, query: str, project_key: Optional[str]) -> Tuple[str, str, str]:
+        return (self.base_url.rstrip('/'), project_key or "", query.strip().casefold())
+
+    def _search_user(self, query: str, project_key: Optional[str]) -> Tuple[Optional[str], bool]:
+        """
+        Uncached lookup. Returns (accountId or None, definitive) where
+        definitive is False if any search did not answer 200.
+        """
+        if project_key:
+            # A user found site-wide but not assignable here would make Jira
+            # reject the whole issue, so there is no global fallback
+            path = "/rest/api/3/user/assignable/search"
+            params = {"project": project_key, "query": query}
+        else:
+            path = "/rest/api/3/user/search"
+            params = {"query": query}
+
+        response = self._request("GET", path, params=params)
+        if response.status_code != 200:
+            return None, False
+        users = response.json()
+        return (users[0].get("accountId") if users else None), True
     
     def update_issue(self, issue_key: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing issue"""
-        url = f"{self.base_url.rstrip('/')}/rest/api/3/issue/{issue_key}"
-        
         payload = {"fields": updates}
         
-        response = requests.put(
-            url,
+        response = self._request(
+            "PUT",
+            f"/rest/api/3/issue/{issue_key}",
             json=payload,
-            auth=HTTPBasicAuth(self.email, self.api_token),
-            headers={"Accept": "application/json", "Content-Type": "application/json"}
+            headers={"Content-Type": "application/json"}
         )
         
         response.raise_for_status()
@@ -0,0 +1,292 @@
+"""
+Persistent job queue backed by the application database
+Jobs survive restarts and run on a pool of worker threads, each with its own session
+"""
+import json
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Job
+
+# Tries to commit a finished job's DONE status
+DONE_COMMIT_ATTEMPTS = 3
+
+
+class JobFailed(Exception):
+    """Raise from a handler to fail the job at once, without retrying"""
+
+
+class JobQueue:
+    """SQLite/SQLAlchemy-backed job queue with a configurable worker pool"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        workers: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        retry_backoff: Optional[float] = None
+    ):
+        self.session_factory = session_factory
+        self.workers = workers if workers is not None else settings.JOB_WORKERS
+        self.max_attempts = max_attempts or settings.JOB_MAX_ATTEMPTS
+        self.poll_interval = poll_interval or settings.JOB_POLL_INTERVAL
+        self.retry_backoff = retry_backoff if retry_backoff is not None else settings.JOB_RETRY_BACKOFF
+
+        self._handlers: Dict[str, Callable[..., Any]] = {}
+        self._wants_job_id: Dict[str, bool] = {}
+        self._failure_hooks: Dict[str, Callable[..., Any]] = {}
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+
+    def register(
+        self,
+        kind: str,
+        handler: Callable[..., Any],
+        pass_job_id: bool = False,
+        on_failure: Optional[Callable[..., Any]] = None
+    ) -> None:
+        """
+        Register a handler for a job kind.
+
+        The handler is called as handler(db=<Session>, **payload) with a session
+        owned by the worker, plus job_id=<id> if pass_job_id is set (for
+        set_progress). Raising an exception schedules a retry; raising
+        JobFailed fails the job immediately.
+
+        on_failure, if given, is called the same way with error=<exception>
+        added once the job has failed for good (JobFailed or attempts
+        exhausted), but not for failures that will be retried.
+        """
+        self._handlers[kind] = handler
+        self._wants_job_id[kind] = pass_job_id
+        if on_failure:
+            self._failure_hooks[kind] = on_failure
+
+    def set_progress(self, db: Session, job_id: int, progress: Dict[str, Any]) -> None:
+        """Store handler progress on the job; committed with the caller's session"""
+        db.query(Job).filter(Job.id == job_id).update({"progress": json.dumps(progress)}, synchronize_session=False)
+
+    def get(self, db: Session, job_id: int) -> Optional[Dict[str, Any]]:
+        """Job status and decoded progress, or None if there is no such job"""
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            return None
+        return {
+            "id": job.id,
+            "kind": job.kind,
+            "status": job.status,
+            "attempts": job.attempts,
+            "last_error": job.last_error,
+            "progress": json.loads(job.progress) if job.progress else None,
+            "created_at": job.created_at,
+            "finished_at": job.finished_at
+        }
+
+    def find_active(self, db: Session, kind: str, **payload_match: Any) -> Optional[int]:
+        """Id of a PENDING/RUNNING job of this kind whose payload contains payload_match"""
+        jobs = (
+            db.query(Job.id, Job.payload)
+            .filter(Job.kind == kind, Job.status.in_(["PENDING", "RUNNING"]))
+            .order_by(Job.id)
+            .all()
+        )
+        for job_id, payload in jobs:
+            data = json.loads(payload or "{}")
+            if all(data.get(k) == v for k, v in payload_match.items()):
+                return job_id
+        return None
+
+    def enqueue(self, kind: str, payload: Optional[Dict[str, Any]] = None, db: Optional[Session] = None) -> int:
+        """
+        Persist a new job and wake an idle worker.
+
+        If db is given the job is added to that session and committed with it,
+        so the job and the rows it refers to are created atomically.
+        """
+        job = Job(
+            kind=kind,
+            payload=json.dumps(payload or {}),
+            status="PENDING",
+            max_attempts=self.max_attempts,
+            run_at=datetime.utcnow()
+        )
+
+        own_session = db is None
+        db = db or self.session_factory()
+        try:
+            db.add(job)
+            db.commit()
+            job_id = job.id
+        finally:
+            if own_session:
+                db.close()
+
+        self._wakeup.set()
+        return job_id
+
+    def start(self) -> None:
+        """Recover jobs interrupted by a previous crash and start the worker pool"""
+        if self._threads:
+            return
+
+        self._stop.clear()
+        recovered = self.recover()
+        if recovered:
+            print(f"Job queue: re-queued {recovered} interrupted job(s)")
+
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker_loop, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        print(f"Job queue started with {self.workers} worker(s)")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Signal workers to exit after their current job"""
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def recover(self) -> int:
+        """
+        Put jobs left RUNNING by a dead process back on the queue.
+
+        Assumes a single queue process per database, so at start-up any RUNNING
+        job belongs to a worker that no longer exists.
+        """
+        db = self.session_factory()
+        try:
+            count = (
+                db.query(Job)
+                .filter(Job.status == "RUNNING")
+                .update({"status": "PENDING", "locked_at": None, "run_at": datetime.utcnow()}, synchronize_session=False)
+            )
+            db.commit()
+            return count
+        finally:
+            db.close()
+
+    def _worker_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ran = self._run_next()
+            except Exception as e:
+                print(f"Job queue worker error: {e}")
+                ran = False
+
+            if not ran:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+    def _claim(self, db: Session) -> Optional[Job]:
+        """Atomically move the oldest due job from PENDING to RUNNING"""
+        now = datetime.utcnow()
+        candidate = (
+            db.query(Job.id)
+            .filter(Job.status == "PENDING", Job.run_at <= now)
+            .order_by(Job.run_at, Job.id)
+            .first()
+        )
+        if not candidate:
+            return None
+
+        # Conditional update guards against another worker claiming the same row
+        claimed = (
+            db.query(Job)
+            .filter(Job.id == candidate.id, Job.status == "PENDING")
+            .update({"status": "RUNNING", "attempts": Job.attempts + 1, "locked_at": now}, synchronize_session=False)
+        )
+        db.commit()
+        if not claimed:
+            return None
+
+        return db.query(Job).filter(Job.id == candidate.id).first()
+
+    def _run_next(self) -> bool:
+        db = self.session_factory()
+        try:
+            job = self._claim(db)
+            if not job:
+                return False
+
+            job_id = job.id
+            handler = self._handlers.get(job.kind)
+            try:
+                if not handler:
+                    raise RuntimeError(f"No handler registered for job kind '{job.kind}'")
+                kwargs = json.loads(job.payload or "{}")
+                if self._wants_job_id.get(job.kind):
+                    kwargs["job_id"] = job_id
+                handler(db=db, **kwargs)
+            except Exception as e:
+                db.rollback()
+                self._record_failure(db, job_id, e)
+                return True
+
+            self._mark_done(db, job_id)
+            return True
+        finally:
+            db.close()
+
+    def _mark_done(self, db: Session, job_id: int) -> None:
+        """
+        Record success, retrying if the database is briefly locked. If it still
+        fails the job stays RUNNING and recover() re-runs it after a restart,
+        so handlers must cope with work that is already done.
+        """
+        for attempt in range(DONE_COMMIT_ATTEMPTS):
+            try:
+                db.query(Job).filter(Job.id == job_id).update(
+                    {"status": "DONE", "finished_at": datetime.utcnow(), "last_error": None},
+                    synchronize_session=False
+                )
+                db.commit()
+                return
+            except Exception as e:
+                db.rollback()
+                print(f"Job {job_id}: could not mark done (attempt {attempt + 1}): {e}")
+                self._stop.wait(attempt + 1)
+
+    def _record_failure(self, db: Session, job_id: int, error: Exception) -> None:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            return
+
+        job.last_error = str(error)
+        job.locked_at = None
+        if job.attempts < job.max_attempts and not isinstance(error, JobFailed):
+            delay = self.retry_backoff * (2 ** (job.attempts - 1))
+            job.status = "PENDING"
+            job.run_at = datetime.utcnow() + timedelta(seconds=delay)
+            print(f"Job {job_id} ({job.kind}) failed on attempt {job.attempts}, retrying in {delay:.0f}s: {error}")
+            db.commit()
+            return
+
+        job.status = "FAILED"
+        job.finished_at = datetime.utcnow()
+        print(f"Job {job_id} ({job.kind}) failed permanently after {job.attempts} attempt(s): {error}")
+        db.commit()
+
+        hook = self._failure_hooks.get(job.kind)
+        if hook:
+            try:
+                kwargs = json.loads(job.payload or "{}")
+                if self._wants_job_id.get(job.kind):
+                    kwargs["job_id"] = job_id
+                hook(db=db, error=error, **kwargs)
+            except Exception as e:
+                db.rollback()
+                print(f"Job {job_id} ({job.kind}) failure hook error: {e}")
+
+
+# Singleton
+job_queue = JobQueue()
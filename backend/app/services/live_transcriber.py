@@ -0,0 +1,104 @@
+"""
+Live incremental transcription
+Transcribes a recording that is still growing in rolling windows, so only the
+tail is left to transcribe when the meeting ends.
+"""
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.services.audio_preprocessor import AudioPreprocessor
+from app.services.segmented_transcriber import offset_words, piece_segments
+
+# Audio kept back from the live edge so a window never ends mid-word
+HOLDBACK_SECONDS = 0.5
+# How far back from the live edge to search for a quiet cut point
+CUT_SEARCH_SECONDS = 3.0
+
+
+class LiveTranscriber:
+    """Rolling-window transcriber for one in-progress recording"""
+
+    def __init__(self, service, preprocessor: AudioPreprocessor, window_seconds: float = 30.0):
+        self.service = service
+        self.preprocessor = preprocessor
+        self.window_seconds = window_seconds
+
+        # Chunks are decoded as they arrive; only audio not yet transcribed is kept
+        self.stream = preprocessor.open_stream()
+        self.transcribed_samples = 0  # audio already transcribed
+        self.segments: List[Dict[str, Any]] = []
+        self.words: List[Dict[str, Any]] = []  # word timings, if the service returns them
+
+    def feed(self, data: bytes) -> None:
+        """Pass the next chunk of the recording to the decoder. Blocking - run in a threadpool."""
+        self.stream.feed(data)
+
+    def transcribe_available(self, final: bool = False) -> Optional[str]:
+        """
+        Transcribe audio recorded since the last window.
+
+        Does nothing until window_seconds of new audio have been decoded,
+        unless final is set, in which case the decoder is flushed and
+        everything left is transcribed. Non-final windows end at a quiet point
+        shortly before the live edge.
+
+        Blocking (ffmpeg + transcription request) - run in a threadpool.
+        Returns the new text, or None if no window was transcribed.
+        """
+        rate = self.preprocessor.sample_rate
+        if final:
+            self.stream.finish()
+
+        start = self.transcribed_samples
+        available = self.stream.decoded_until
+        if not final and (available - start) / rate < self.window_seconds + HOLDBACK_SECONDS:
+            return None
+
+        samples = self.stream.samples()
+        base = self.stream.base
+        if final:
+            end = base + samples.size
+        else:
+            edge = base + samples.size - int(HOLDBACK_SECONDS * rate)
+            end = base + self.preprocessor.quietest_point(
+                samples, edge - int(CUT_SEARCH_SECONDS * rate) - base, edge - base
+            )
+
+        if end - start < rate // 2:
+            # Less than half a second left - not worth a request
+            self._advance(end)
+            return None
+
+        fd, window_path = tempfile.mkstemp(prefix="meeto-live-", suffix=".ogg", dir=settings.UPLOAD_DIR)
+        os.close(fd)
+        try:
+            self.preprocessor.encode(samples[start - base:end - base], window_path)
+            result = self.service.transcribe(window_path)
+        finally:
+            os.remove(window_path)
+
+        offset = start / rate
+        text = (result.get("text") or "").strip()
+        window_words = offset_words(result.get("words"), offset)
+        self.segments.extend(piece_segments(result, offset, end / rate, window_words))
+        self.words.extend(window_words)
+        self._advance(end)
+        return text or None
+
+    def _advance(self, end: int) -> None:
+        self.transcribed_samples = end
+        self.stream.discard_before(end)
+
+    def close(self) -> None:
+        """Stop the decoder; call when the recording ends or is abandoned"""
+        self.stream.close()
+
+    def result(self) -> Dict[str, Any]:
+        """Everything transcribed so far, in the shape returned by transcription services"""
+        return {
+            "text": " ".join(seg["text"] for seg in self.segments),
+            "segments": self.segments,
+            "words": self.words
+        }
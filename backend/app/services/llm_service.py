@@ -2,10 +2,15 @@
 LLM service for extracting action items from transcripts
 Supports Groq API, OpenAI API (optional), and local models via Ollama
 """
+import difflib
 import json
+import math
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import List, Dict, Any, Optional
 from app.config import settings
+from app.services.llm_cache import llm_cache
 import os
 
 # Try to import Groq
@@ -23,6 +28,29 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# Part of the LLM cache key - bump whenever prompts or result post-processing
+# change so stale cached results are not reused
+PROMPT_VERSION = "1"
+
+# Task extraction rules shared by the extraction and combined prompts
+TASK_REQUIREMENTS = (
+    "- Extract only explicit action items or tasks mentioned in the transcript. Do NOT hallucinate.\n"
+    "- Each task must be a single concise one-line description (preferably under 140 characters).\n"
+    "- Identify responsible person if mentioned (owner). If not clearly stated, set owner to null.\n"
+    "- Identify a deadline if mentioned and normalize to YYYY-MM-DD; otherwise null.\n"
+    "- Assign priority: one of \"low\"|\"medium\"|\"high\"|\"critical\". Default to \"medium\" when unclear.\n"
+    "- Provide a confidence score between 0.0 and 1.0.\n"
+)
+TASK_LIST_FORMAT = (
+    "[\n    {\n      \"description\": \"...\",\n      \"owner\": \"...\" or null,\n      \"deadline\": \"YYYY-MM-DD\" or null,\n      \"priority\": \"low|medium|high|critical\",\n      \"confidence\": 0.0-1.0\n    }\n  ]"
+)
+
+# Shared pool for running independent LLM calls concurrently
+_llm_executor = ThreadPoolExecutor(max_workers=settings.LLM_MAX_CONCURRENCY, thread_name_prefix="llm")
+# Separate pool for per-chunk map calls: they are submitted from _llm_executor
+# threads, and sharing one pool could deadlock with every worker waiting on a map
+_map_executor = ThreadPoolExecutor(max_workers=settings.LLM_MAX_CONCURRENCY, thread_name_prefix="llm-map")
+
 
 class LLMService:
     """Service for extracting action items using LLM (Groq by default)"""
@@ -65,6 +93,122 @@ class LLMService:
             error_msg += "\n- ENABLE_LOCAL_MODE (with Ollama)"
             raise ValueError(error_msg)
     
+    def process_transcript(self, transcript: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run action item extraction and summarization concurrently.
+
+        timeout (defaults to settings.LLM_CALL_TIMEOUT) is allowed per LLM
+        request; a long transcript processed in chunks gets proportionally
+        longer. A failure or timeout in one call does not discard the other's
+        result.
+
+        Returns:
+            {"tasks": list or None, "summary": str or None, "errors": {stage: message}}
+        """
+        timeout = timeout or settings.LLM_CALL_TIMEOUT
+
+        if settings.LLM_COMBINED_MODE and self.client:
+            budget = timeout * self._request_rounds(transcript, calls_per_chunk=1)
+            combined_future = _llm_executor.submit(self.extract_minutes_and_tasks, transcript)
+            try:
+                combined = combined_future.result(timeout=budget)
+                return {"tasks": combined["tasks"], "summary": combined["summary"], "errors": {}}
+            except Exception as e:
+                if not combined_future.done():
+                    # Still running, and a running call cannot be cancelled: the
+                    # fallback would send the transcript again alongside it
+                    message = f"timed out after {budget:g}s"
+                    return {"tasks": None, "summary": None, "errors": {"tasks": message, "summary": message}}
+                # Fall back to the two-call path below
+                print(f"Combined LLM extraction failed, using separate calls: {e or type(e).__name__}")
+
+        futures = {
+            "tasks": _llm_executor.submit(lambda: self.extract_action_items(transcript).get("tasks", [])),
+            "summary": _llm_executor.submit(self.summarize_transcript, transcript),
+        }
+
+        # Both calls start together, so they share one deadline; their chunk
+        # requests share the map pool
+        budget = timeout * self._request_rounds(transcript, calls_per_chunk=2)
+        deadline = time.monotonic() + budget
+        result: Dict[str, Any] = {"tasks": None, "summary": None, "errors": {}}
+        for stage, future in futures.items():
+            try:
+                result[stage] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                # Only stops a call that has not started; a running one finishes unused
+                future.cancel()
+                result["errors"][stage] = f"timed out after {budget:g}s"
+            except Exception as e:
+                result["errors"][stage] = str(e)
+
+        return result
+
+    def extract_minutes_and_tasks(self, transcript: str) -> Dict[str, Any]:
+        """
+        Get meeting minutes and action items from a single JSON-mode completion.
+
+        Sends the transcript once instead of twice. Raises if the provider fails
+        or the response lacks a usable summary, so callers can fall back to the
+        separate extract_action_items/summarize_transcript calls.
+
+        Returns:
+            {"summary": str, "tasks": [...]} with tasks normalized and filtered
+            exactly as in extract_action_items
+        """
+        if len(transcript) > settings.LLM_CHUNK_CHARS:
+            partials = self._map_chunks(self.extract_minutes_and_tasks, self._split_transcript(transcript))
+            return {
+                "summary": self._reduce_summaries([p["summary"] for p in partials]),
+                "tasks": self._merge_tasks([t for p in partials for t in p["tasks"]]),
+            }
+
+        cache_key = self._cache_key("combined", transcript)
+        cached = llm_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
+
+        request_params = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": (
+                        "You are an expert at analyzing meeting transcripts. Produce concise meeting minutes and extract clear, actionable tasks.\n\n"
+                        "Minutes: short bullet points under these headings (if present): Attendees, Decisions, Action Items (one-line per item), Key Takeaways.\n\n"
+                        "Task requirements:\n"
+                        f"{TASK_REQUIREMENTS}\n"
+                        "Return ONLY valid JSON in this exact format (no extra text):\n"
+                        f"{{\n  \"summary\": \"minutes as plain text with bullets\",\n  \"tasks\": {TASK_LIST_FORMAT}\n}}\n\n"
+                        "If there are no action items, use an empty tasks list. Be conservative and prefer omitting unclear items."
+                    )
+                },
+                {"role": "user", "content": self._build_extraction_prompt(transcript)}
+            ],
+            "temperature": 0.1,
+            "timeout": settings.LLM_CALL_TIMEOUT,
+        }
+
+        if self.provider in ("groq", "openai"):
+            request_params["response_format"] = {"type": "json_object"}
+
+        response = self.client.chat.completions.create(**request_params)
+        content = response.choices[0].message.content
+
+        parsed = self._parse_json_content(content, "summary")
+        if not parsed or not isinstance(parsed.get("summary"), str) or not parsed["summary"].strip():
+            raise ValueError("Combined response missing summary")
+        if not isinstance(parsed.get("tasks", []), list):
+            raise ValueError("Combined response has malformed tasks")
+
+        result = {
+            "summary": parsed["summary"].strip(),
+            "tasks": self._normalize_tasks(parsed.get("tasks", []))["tasks"],
+        }
+        if cache_key:
+            llm_cache.set(cache_key, result)
+        return result
+
     def extract_action_items(self, transcript: str) -> Dict[str, Any]:
         """
         Extract action items from meeting transcript
@@ -75,164 +219,189 @@ class LLMService:
         Returns:
             Dictionary with extracted tasks in the required format
         """
+        if not self.client:
+            # Fallback: Simple regex-based extraction
+            return self._extract_simple(transcript)
+
+        if len(transcript) > settings.LLM_CHUNK_CHARS:
+            # Map-reduce: each chunk goes through this method (and its cache)
+            chunk_results = self._map_chunks(self.extract_action_items, self._split_transcript(transcript))
+            return {"tasks": self._merge_tasks([t for r in chunk_results for t in r.get("tasks", [])])}
+
+        cache_key = self._cache_key("extract", transcript)
+        cached = llm_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
+
+        try:
+            result = self._extract_with_llm(transcript)
+        except Exception as e:
+            print(f"Error extracting action items with {self.provider}: {e}")
+            # Fallback to simple extraction (not cached, so a later call can retry the LLM)
+            return self._extract_simple(transcript)
+
+        if cache_key:
+            llm_cache.set(cache_key, result)
+        return result
+
+    def _extract_with_llm(self, transcript: str) -> Dict[str, Any]:
+        """Run LLM extraction; raises on provider errors"""
         prompt = self._build_extraction_prompt(transcript)
         
-        try:
-            if self.client:
-                # Prepare request parameters with a strict system prompt
-                request_params = {
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": (
-                                "You are an expert at analyzing meeting transcripts and extracting clear, actionable tasks.\n\n"
-                                "Requirements:\n"
-                                "- Extract only explicit action items or tasks mentioned in the transcript. Do NOT hallucinate.\n"
-                                "- Each task must be a single concise one-line description (preferably under 140 characters).\n"
-                                "- Identify responsible person if mentioned (owner). If not clearly stated, set owner to null.\n"
-                                "- Identify a deadline if mentioned and normalize to YYYY-MM-DD; otherwise null.\n"
-                                "- Assign priority: one of \"low\"|\"medium\"|\"high\"|\"critical\". Default to \"medium\" when unclear.\n"
-                                "- Provide a confidence score between 0.0 and 1.0.\n\n"
-                                "Return ONLY valid JSON in this exact format (no extra text):\n"
-                                "{\n  \"tasks\": [\n    {\n      \"description\": \"...\",\n      \"owner\": \"...\" or null,\n      \"deadline\": \"YYYY-MM-DD\" or null,\n      \"priority\": \"low|medium|high|critical\",\n      \"confidence\": 0.0-1.0\n    }\n  ]\n}\n\n"
-                                "If there are no action items, return {\"tasks\": []}. Be conservative and prefer omitting unclear items."
-                            )
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.1,
-                }
-
-                # Request structured response where supported
-                if self.provider in ("groq", "openai"):
-                    request_params["response_format"] = {"type": "json_object"}
-
-                response = self.client.chat.completions.create(**request_params)
-                content = response.choices[0].message.content
-
-                # Try strict JSON parse first
-                tasks_out = []
-                try:
-                    parsed = json.loads(content)
-                except Exception:
-                    # Try to extract JSON substring if model added surrounding text
-                    m = re.search(r"\{\s*\"tasks\"[\s\S]*\}\s*$", content)
-                    if not m:
-                        m = re.search(r"\{\s*\"tasks\"[\s\S]*\}", content)
-                    if m:
-                        try:
-                            parsed = json.loads(m.group(0))
-                        except Exception:
-                            parsed = {"tasks": []}
-                    else:
-                        parsed = {"tasks": []}
-
-                for t in parsed.get("tasks", []):
-                    # Normalize and enforce one-line concise descriptions
-                    desc = t.get("description") if isinstance(t.get("description"), str) else ""
-                    desc = re.sub(r"\s+", ' ', desc).strip()
-                    # If long, take the first sentence or truncate
-                    if len(desc) > 140:
-                        first_sent = re.split(r"[\.\!\?]\s", desc)[0]
-                        if len(first_sent) >= 10:
-                            desc = first_sent.strip()
-                        desc = (desc[:137].rstrip() + '...') if len(desc) > 140 else desc
-
-                    owner = t.get("owner") if t.get("owner") else None
-
-                    # Normalize deadline
-                    deadline = None
-                    if t.get("deadline"):
-                        dl = str(t.get("deadline"))
-                        from datetime import datetime
-                        for fmt in ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%m/%d/%Y"):
-                            try:
-                                dt = datetime.strptime(dl, fmt)
-                                deadline = dt.strftime("%Y-%m-%d")
-                                break
-                            except Exception:
-                                continue
-
-                    priority = (t.get("priority") or "medium").lower()
-                    if priority not in ("low", "medium", "high", "critical"):
-                        priority = "medium"
+        # Prepare request parameters with a strict system prompt
+        request_params = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": (
+                        "You are an expert at analyzing meeting transcripts and extracting clear, actionable tasks.\n\n"
+                        "Requirements:\n"
+                        f"{TASK_REQUIREMENTS}\n"
+                        "Return ONLY valid JSON in this exact format (no extra text):\n"
+                        f"{{\n  \"tasks\": {TASK_LIST_FORMAT}\n}}\n\n"
+                        "If there are no action items, return {\"tasks\": []}. Be conservative and prefer omitting unclear items."
+                    )
+                },
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.1,
+            "timeout": settings.LLM_CALL_TIMEOUT,
+        }
+
+        # Request structured response where supported
+        if self.provider in ("groq", "openai"):
+            request_params["response_format"] = {"type": "json_object"}
+
+        response = self.client.chat.completions.create(**request_params)
+        content = response.choices[0].message.content
+
+        parsed = self._parse_json_content(content, "tasks") or {"tasks": []}
+        return self._normalize_tasks(parsed.get("tasks", []))
+
+    def _parse_json_content(self, content: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse a JSON object from model output, tolerating text around it.
 
+        Looks for an object starting with `key` if strict parsing fails.
+        Returns None if no object can be parsed.
+        """
+        # Try strict JSON parse first
+        try:
+            parsed = json.loads(content)
+            return parsed if isinstance(parsed, dict) else None
+        except Exception:
+            pass
+
+        # Try to extract JSON substring if model added surrounding text
+        m = re.search(r"\{\s*\"%s\"[\s\S]*\}\s*$" % re.escape(key), content)
+        if not m:
+            m = re.search(r"\{\s*\"%s\"[\s\S]*\}" % re.escape(key), content)
+        if m:
+            try:
+                return json.loads(m.group(0))
+            except Exception:
+                return None
+        return None
+
+    def _normalize_tasks(self, raw_tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Clean up model-produced tasks and drop low-confidence ones"""
+        tasks_out = []
+        for t in raw_tasks:
+            # Normalize and enforce one-line concise descriptions
+            desc = t.get("description") if isinstance(t.get("description"), str) else ""
+            desc = re.sub(r"\s+", ' ', desc).strip()
+            # If long, take the first sentence or truncate
+            if len(desc) > 140:
+                first_sent = re.split(r"[\.\!\?]\s", desc)[0]
+                if len(first_sent) >= 10:
+                    desc = first_sent.strip()
+                desc = (desc[:137].rstrip() + '...') if len(desc) > 140 else desc
+
+            owner = t.get("owner") if t.get("owner") else None
+
+            # Normalize deadline
+            deadline = None
+            if t.get("deadline"):
+                dl = str(t.get("deadline"))
+                from datetime import datetime
+                for fmt in ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%m/%d/%Y"):
                     try:
-                        confidence = float(t.get("confidence", 0.5))
+                        dt = datetime.strptime(dl, fmt)
+                        deadline = dt.strftime("%Y-%m-%d")
+                        break
                     except Exception:
-                        confidence = 0.5
-
-                    tasks_out.append({
-                        "description": desc,
-                        "owner": owner,
-                        "deadline": deadline,
-                        "priority": priority,
-                        "confidence": round(confidence, 2)
-                    })
-
-                # Confidence filtering and deterministic normalization
-                filtered = []
-                threshold = getattr(settings, "TASK_CONFIDENCE_THRESHOLD", 0.4)
-                normalize_enabled = getattr(settings, "NORMALIZE_TASKS", True)
-
-                def normalize_description(d, owner_val=None):
-                    d = d or ""
-                    d = d.strip()
-                    # Remove polite prefixes
-                    d = re.sub(r'^(please|pls|kindly|could you|can you|would you|let\'s|let us|we should|we need to)\b[:,]?\s*', '', d, flags=re.I)
-                    # If starts with "we" remove leading "we (should|will|need to)" to make imperative
-                    d = re.sub(r'^(we\s+(should|will|need to)\s+)', '', d, flags=re.I)
-                    # If starts with "NAME will ..." or "NAME to ..." try to extract owner and make rest imperative
-                    m = re.match(r'^([A-Z][a-zA-Z]+)\s+(will|shall|should|to)\s+(.*)$', d)
-                    if m:
-                        possible_owner = m.group(1)
-                        rest = m.group(3).strip()
-                        if not owner_val:
-                            owner_val = possible_owner
-                        d = rest
-                    # Ensure starts with a verb: if starts with gerund or noun phrases, try to prefix with verb 'Do' (fallback)
-                    if d and not re.match(r'^[A-Za-z]+\s', d):
-                        d = d
-                    # Capitalize first letter
-                    if d:
-                        d = d[0].upper() + d[1:]
-                    # Collapse whitespace and keep one-line
-                    d = re.sub(r"\s+", ' ', d).strip()
-                    if len(d) > 140:
-                        d = d[:137].rstrip() + '...'
-                    return d, owner_val
-
-                for t in tasks_out:
-                    conf = t.get("confidence", 0.5) or 0.5
-                    if conf < threshold:
-                        # Skip low confidence items
                         continue
 
-                    desc = t.get("description", "")
-                    owner = t.get("owner")
-                    if normalize_enabled:
-                        desc, owner = normalize_description(desc, owner)
-
-                    filtered.append({
-                        "description": desc,
-                        "owner": owner,
-                        "deadline": t.get("deadline"),
-                        "priority": t.get("priority", "medium"),
-                        "confidence": t.get("confidence", 0.5)
-                    })
-
-                return {"tasks": filtered}
-
-                return {"tasks": tasks_out}
-            else:
-                # Fallback: Simple regex-based extraction
-                return self._extract_simple(transcript)
-
-        except Exception as e:
-            print(f"Error extracting action items with {self.provider}: {e}")
-            # Fallback to simple extraction
-            return self._extract_simple(transcript)
+            priority = (t.get("priority") or "medium").lower()
+            if priority not in ("low", "medium", "high", "critical"):
+                priority = "medium"
+
+            try:
+                confidence = float(t.get("confidence", 0.5))
+            except Exception:
+                confidence = 0.5
+
+            tasks_out.append({
+                "description": desc,
+                "owner": owner,
+                "deadline": deadline,
+                "priority": priority,
+                "confidence": round(confidence, 2)
+            })
+
+        # Confidence filtering and deterministic normalization
+        filtered = []
+        threshold = getattr(settings, "TASK_CONFIDENCE_THRESHOLD", 0.4)
+        normalize_enabled = getattr(settings, "NORMALIZE_TASKS", True)
+
+        def normalize_description(d, owner_val=None):
+            d = d or ""
+            d = d.strip()
+            # Remove polite prefixes
+            d = re.sub(r'^(please|pls|kindly|could you|can you|would you|let\'s|let us|we should|we need to)\b[:,]?\s*', '', d, flags=re.I)
+            # If starts with "we" remove leading "we (should|will|need to)" to make imperative
+            d = re.sub(r'^(we\s+(should|will|need to)\s+)', '', d, flags=re.I)
+            # If starts with "NAME will ..." or "NAME to ..." try to extract owner and make rest imperative
+            m = re.match(r'^([A-Z][a-zA-Z]+)\s+(will|shall|should|to)\s+(.*)$', d)
+            if m:
+                possible_owner = m.group(1)
+                rest = m.group(3).strip()
+                if not owner_val:
+                    owner_val = possible_owner
+                d = rest
+            # Ensure starts with a verb: if starts with gerund or noun phrases, try to prefix with verb 'Do' (fallback)
+            if d and not re.match(r'^[A-Za-z]+\s', d):
+                d = d
+            # Capitalize first letter
+            if d:
+                d = d[0].upper() + d[1:]
+            # Collapse whitespace and keep one-line
+            d = re.sub(r"\s+", ' ', d).strip()
+            if len(d) > 140:
+                d = d[:137].rstrip() + '...'
+            return d, owner_val
+
+        for t in tasks_out:
+            conf = t.get("confidence", 0.5) or 0.5
+            if conf < threshold:
+                # Skip low confidence items
+                continue
+
+            desc = t.get("description", "")
+            owner = t.get("owner")
+            if normalize_enabled:
+                desc, owner = normalize_description(desc, owner)
+
+            filtered.append({
+                "description": desc,
+                "owner": owner,
+                "deadline": t.get("deadline"),
+                "priority": t.get("priority", "medium"),
+                "confidence": t.get("confidence", 0.5)
+            })
+
+        return {"tasks": filtered}
 
     def summarize_transcript(self, transcript: str) -> str:
         """
@@ -240,46 +409,196 @@ class LLMService:
 
         Returns a plain text summary.
         """
-        # Keep the prompt focused and ask for short bullet points with clear one-line action summaries
-        sample = transcript if len(transcript) < 12000 else transcript[:12000]
+        if not self.client:
+            # Fallback simple summary: first 400 chars
+            return transcript.strip()[:400] + ("..." if len(transcript) > 400 else "")
+
+        if len(transcript) > settings.LLM_CHUNK_CHARS:
+            partials = self._map_chunks(self.summarize_transcript, self._split_transcript(transcript))
+            return self._reduce_summaries(partials)
+
+        # Keep the prompt focused and ask for short bullet points with clear one-line action summaries.
+        # Longer transcripts were chunked above, so the whole text fits.
         prompt = (
             "Produce concise meeting minutes from the transcript below. Respond with short bullet points under these headings (if present): Attendees, Decisions, Action Items (one-line per item), Key Takeaways. "
             "Action items must be one-line, start with a verb, and be under 140 characters. Do not add any tasks not present in the transcript. "
-            f"Transcript:\n{sample}"
+            f"Transcript:\n{transcript}"
         )
 
-        try:
-            if self.client:
-                request_params = {
-                    "model": self.model,
-                    "messages": [
-                        {"role": "system", "content": "You are an assistant that summarizes meeting transcripts into concise minutes with bullets."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.2,
-                }
-
-                if self.provider == "groq":
-                    request_params["response_format"] = {"type": "text"}
-                elif self.provider == "openai":
-                    request_params["response_format"] = {"type": "text"}
-
-                response = self.client.chat.completions.create(**request_params)
-                content = response.choices[0].message.content
-                return content.strip()
-            else:
-                # Fallback simple summary: first 400 chars
-                return transcript.strip()[:400] + ("..." if len(transcript) > 400 else "")
+        cache_key = self._cache_key("summary", transcript)
+        cached = llm_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
 
+        try:
+            summary = self._complete_text(
+                "You are an assistant that summarizes meeting transcripts into concise minutes with bullets.",
+                prompt
+            )
         except Exception as e:
             print(f"Error summarizing transcript with {self.provider}: {e}")
             return transcript.strip()[:400] + ("..." if len(transcript) > 400 else "")
+
+        if cache_key:
+            llm_cache.set(cache_key, summary)
+        return summary
+
+    def _complete_text(self, system_prompt: str, prompt: str) -> str:
+        """Plain-text chat completion; raises on provider errors"""
+        request_params = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.2,
+            "timeout": settings.LLM_CALL_TIMEOUT,
+        }
+
+        if self.provider == "groq":
+            request_params["response_format"] = {"type": "text"}
+        elif self.provider == "openai":
+            request_params["response_format"] = {"type": "text"}
+
+        response = self.client.chat.completions.create(**request_params)
+        return response.choices[0].message.content.strip()
+
+    def _reduce_summaries(self, partials: List[str]) -> str:
+        """Merge per-chunk minutes into one set of minutes"""
+        if len(partials) == 1:
+            return partials[0]
+        joined = "\n\n".join(f"Part {i + 1}:\n{p}" for i, p in enumerate(partials))
+
+        cache_key = self._cache_key("summary-reduce", joined)
+        cached = llm_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
+
+        prompt = (
+            "The following are minutes for consecutive parts of one meeting. Merge them into a single set of concise minutes with short bullet points under these headings (if present): Attendees, Decisions, Action Items (one-line per item), Key Takeaways. "
+            "Remove duplicates caused by overlapping parts. Do not add anything not present in the parts.\n\n"
+            f"{joined}"
+        )
+        try:
+            summary = self._complete_text(
+                "You are an assistant that merges partial meeting minutes into concise minutes with bullets.",
+                prompt
+            )
+        except Exception as e:
+            print(f"Error merging partial summaries with {self.provider}: {e}")
+            return joined
+
+        if cache_key:
+            llm_cache.set(cache_key, summary)
+        return summary
+
+    def _request_rounds(self, transcript: str, calls_per_chunk: int) -> int:
+        """
+        Consecutive LLM request times that processing transcript takes: 1 for
+        a short transcript; for a chunked one, its chunk requests
+        (calls_per_chunk each) followed by one reduce request. The map pool
+        is shared by up to JOB_WORKERS meetings at once, so only its fair
+        share of LLM_MAX_CONCURRENCY is assumed to be available.
+        """
+        if not self.client or len(transcript) <= settings.LLM_CHUNK_CHARS:
+            return 1
+        requests = len(self._split_transcript(transcript)) * calls_per_chunk
+        concurrency = max(1, settings.LLM_MAX_CONCURRENCY // max(1, settings.JOB_WORKERS))
+        return math.ceil(requests / concurrency) + 1
+
+    def _map_chunks(self, fn, chunks: List[str]) -> List[Any]:
+        """Apply fn to every chunk with bounded concurrency, preserving order"""
+        return list(_map_executor.map(fn, chunks))
+
+    def _split_transcript(self, transcript: str) -> List[str]:
+        """
+        Split a long transcript into overlapping chunks of at most
+        settings.LLM_CHUNK_CHARS characters.
+
+        Chunks break on speaker-turn/line or sentence boundaries, and each chunk
+        repeats up to settings.LLM_CHUNK_OVERLAP characters of the previous
+        one so items spanning a boundary are seen whole.
+        """
+        max_chars = settings.LLM_CHUNK_CHARS
+        overlap = settings.LLM_CHUNK_OVERLAP
+
+        # Units are sentences or lines, including their trailing whitespace
+        units = []
+        for m in re.finditer(r".+?(?:[.!?]+(?:\s+|$)|\n+|$)", transcript, re.S):
+            unit = m.group(0)
+            # Hard-split a single unit that is longer than a chunk
+            while len(unit) > max_chars:
+                units.append(unit[:max_chars])
+                unit = unit[max_chars:]
+            if unit:
+                units.append(unit)
+
+        chunks = []
+        current: List[str] = []
+        size = 0
+        for unit in units:
+            if current and size + len(unit) > max_chars:
+                chunks.append("".join(current))
+                # Carry trailing units into the next chunk as overlap
+                carried: List[str] = []
+                carried_size = 0
+                for prev in reversed(current):
+                    if carried_size + len(prev) > overlap or carried_size + len(prev) + len(unit) > max_chars:
+                        break
+                    carried.insert(0, prev)
+                    carried_size += len(prev)
+                current, size = carried, carried_size
+            current.append(unit)
+            size += len(unit)
+
+        if current:
+            chunks.append("".join(current))
+        return chunks
+
+    def _merge_tasks(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge tasks extracted from overlapping chunks.
+
+        Near-identical descriptions (same or unknown owner) are collapsed into
+        one task, keeping the highest confidence and filling in missing fields.
+        """
+        def key(desc):
+            return re.sub(r"[^a-z0-9 ]", "", (desc or "").lower()).strip()
+
+        merged: List[Dict[str, Any]] = []
+        for task in tasks:
+            task_key = key(task.get("description"))
+            duplicate = None
+            for existing in merged:
+                owners_compatible = not task.get("owner") or not existing.get("owner") or task["owner"] == existing["owner"]
+                if owners_compatible and difflib.SequenceMatcher(None, task_key, key(existing.get("description"))).ratio() >= 0.85:
+                    duplicate = existing
+                    break
+
+            if not duplicate:
+                merged.append(dict(task))
+                continue
+
+            for field in ("owner", "deadline"):
+                if not duplicate.get(field) and task.get(field):
+                    duplicate[field] = task[field]
+            if (task.get("confidence") or 0) > (duplicate.get("confidence") or 0):
+                duplicate["description"] = task.get("description")
+                duplicate["priority"] = task.get("priority") or duplicate.get("priority")
+                duplicate["confidence"] = task.get("confidence")
+
+        return merged
+
+    def _cache_key(self, kind: str, transcript: str) -> Optional[str]:
+        """Cache key for an LLM result, or None when caching is disabled"""
+        if not llm_cache:
+            return None
+        return llm_cache.make_key(kind, self.provider, self.model, PROMPT_VERSION, transcript)
     
     def _build_extraction_prompt(self, transcript: str) -> str:
         """Build the prompt for action item extraction"""
-        # Truncate very long transcripts to keep prompts within model context windows
-        sample = transcript if len(transcript) < 20000 else transcript[:20000]
-        return f"Analyze the following meeting transcript and extract all explicit action items. Return only JSON as instructed in the system prompt.\n\nTranscript:\n{sample}"
+        # Callers split transcripts longer than LLM_CHUNK_CHARS, so the whole text is sent
+        return f"Analyze the following meeting transcript and extract all explicit action items. Return only JSON as instructed in the system prompt.\n\nTranscript:\n{transcript}"
     
     def _extract_simple(self, transcript: str) -> Dict[str, Any]:
         """Fallback simple extraction using regex patterns"""
@@ -0,0 +1,171 @@
+"""
+Full-text search over meetings
+A SQLite FTS5 table holds each completed meeting's title, transcript, summary
+and action items, keyed by meeting id. Requires an SQLite build with FTS5.
+"""
+import html
+import re
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.models import Meeting
+
+TABLE = "meeting_search"
+
+# bm25 column weights: title, transcript, summary, action_items
+BM25_WEIGHTS = (5.0, 1.0, 2.0, 3.0)
+SNIPPET_TOKENS = 12
+BACKFILL_BATCH = 100
+
+# Placeholders around matches in snippets; replaced with <mark> after HTML escaping
+_MARK_START = "\x02"
+_MARK_END = "\x03"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchIndex:
+    """FTS5 index of meetings; rowid is the meeting id"""
+
+    def __init__(self, bind: Engine):
+        if bind.dialect.name != "sqlite":
+            raise ValueError("full-text search requires SQLite with FTS5")
+
+        # Prefix indexes keep "word*" queries fast. Changing the options of an
+        # existing table means dropping it and letting backfill() rebuild it.
+        with bind.begin() as conn:
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5("
+                "title, transcript, summary, action_items, "
+                "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3 4')"
+            ))
+
+    def index_meeting(self, db: Session, meeting: Meeting) -> None:
+        """Add or replace a meeting's entry; committed with db"""
+        db.execute(text(f"DELETE FROM {TABLE} WHERE rowid = :id"), {"id": meeting.id})
+        db.execute(
+            text(f"INSERT INTO {TABLE} (rowid, title, transcript, summary, action_items) VALUES (:id, :title, :transcript, :summary, :items)"),
+            {
+                "id": meeting.id,
+                "title": meeting.title or "",
+                "transcript": meeting.transcript_text or "",
+                "summary": meeting.summary_text or "",
+                "items": "\n".join(item.description or "" for item in meeting.action_items)
+            }
+        )
+
+    def remove_meeting(self, db: Session, meeting_id: int) -> None:
+        db.execute(text(f"DELETE FROM {TABLE} WHERE rowid = :id"), {"id": meeting_id})
+
+    def backfill(self, db: Session) -> int:
+        """
+        Index completed meetings that are missing from the index. Returns the
+        count. A batch that fails is retried one meeting at a time, and
+        meetings that still fail are logged and skipped, so one unreadable
+        meeting cannot stop the rest (or startup).
+        """
+        count = 0
+        after = 0
+        while True:
+            ids = db.execute(text(
+                f"SELECT id FROM meetings WHERE status = 'COMPLETED' AND id > :after "
+                f"AND id NOT IN (SELECT rowid FROM {TABLE}) ORDER BY id LIMIT :n"
+            ), {"after": after, "n": BACKFILL_BATCH}).scalars().all()
+            if not ids:
+                return count
+            after = ids[-1]
+
+            try:
+                for meeting in db.query(Meeting).filter(Meeting.id.in_(ids)).all():
+                    self.index_meeting(db, meeting)
+                db.commit()
+                count += len(ids)
+            except Exception:
+                db.rollback()
+                count += self._backfill_each(db, ids)
+
+    def _backfill_each(self, db: Session, ids: List[int]) -> int:
+        count = 0
+        for meeting_id in ids:
+            try:
+                meeting = db.get(Meeting, meeting_id)
+                if meeting:
+                    self.index_meeting(db, meeting)
+                    db.commit()
+                    count += 1
+            except Exception as e:
+                db.rollback()
+                print(f"Search backfill failed for meeting {meeting_id}: {e}")
+        return count
+
+    def search(self, db: Session, query: str, limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Meetings matching every word of query, best match first.
+
+        Words are matched as prefixes, so "deploy" also finds "deployment".
+        Returns [] for a query without searchable words.
+        """
+        match = self.to_match_expression(query)
+        if not match:
+            return []
+
+        weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+        rows = db.execute(
+            text(
+                f"SELECT s.rowid AS meeting_id, bm25({TABLE}, {weights}) AS rank, "
+                f"snippet({TABLE}, -1, :start, :end, '…', :tokens) AS snippet, "
+                f"m.title, m.timestamp, m.status "
+                f"FROM {TABLE} s JOIN meetings m ON m.id = s.rowid "
+                f"WHERE {TABLE} MATCH :match "
+                f"ORDER BY rank LIMIT :limit OFFSET :offset"
+            ),
+            {
+                "match": match,
+                "start": _MARK_START,
+                "end": _MARK_END,
+                "tokens": SNIPPET_TOKENS,
+                "limit": limit,
+                "offset": offset
+            }
+        ).mappings().all()
+
+        return [
+            {
+                "meeting_id": row["meeting_id"],
+                "title": row["title"],
+                "timestamp": row["timestamp"],
+                "status": row["status"],
+                "rank": row["rank"],
+                "snippet": self._snippet_html(row["snippet"])
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def to_match_expression(query: str) -> Optional[str]:
+        """
+        Turn free text into a safe FTS5 query: every word quoted (so FTS5
+        operators and punctuation in user input cannot cause syntax errors),
+        all words required, each matched as a prefix.
+        """
+        words = _TOKEN_RE.findall(query or "")
+        if not words:
+            return None
+        return " ".join(f'"{word}"*' for word in words)
+
+    @staticmethod
+    def _snippet_html(snippet: Optional[str]) -> str:
+        escaped = html.escape(snippet or "")
+        return escaped.replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
+
+
+# Singleton
+try:
+    search_index = SearchIndex(engine)
+except Exception as e:
+    print(f"Warning: Full-text search not available: {e}")
+    search_index = None
@@ -0,0 +1,132 @@
+"""
+Parallel segmented transcription
+Long recordings are cut at quiet points into segments, transcribed concurrently
+through an existing transcription service and stitched back together with
+corrected timestamps.
+"""
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.services.audio_preprocessor import AudioPreprocessor, audio_preprocessor
+from app.services.transcript_timeline import group_words
+
+
+def _field(item: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a dict or an SDK object"""
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+def offset_words(words: Optional[List[Any]], offset: float) -> List[Dict[str, Any]]:
+    """Word timings shifted by offset seconds, as plain dicts"""
+    shifted = []
+    for word in words or []:
+        start, end = _field(word, "start"), _field(word, "end")
+        shifted.append({
+            "start": round(offset + float(start), 3) if start is not None else None,
+            "end": round(offset + float(end), 3) if end is not None else None,
+            "text": (_field(word, "text") or _field(word, "word") or "").strip()
+        })
+    return shifted
+
+
+def piece_segments(result: Dict[str, Any], offset: float, end: float, words: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Segments of one transcribed piece of a recording, shifted by offset
+    seconds: the service's own segments, else its (already shifted) word
+    timings grouped into segments, else the whole piece as one segment.
+    """
+    inner = result.get("segments") or []
+    if inner:
+        return [{
+            "start": round(offset + float(_field(seg, "start", 0.0)), 3),
+            "end": round(offset + float(_field(seg, "end", 0.0)), 3),
+            "text": (_field(seg, "text", "") or "").strip()
+        } for seg in inner]
+    if words:
+        # Word timings only - group them so every piece has segments
+        return [
+            {"start": start, "end": stop, "text": seg_text}
+            for start, stop, seg_text in group_words([(w["start"], w["end"], w["text"]) for w in words])
+        ]
+    text = (result.get("text") or "").strip()
+    if text:
+        # Service returned no timings - the whole piece is one segment
+        return [{"start": round(offset, 3), "end": round(end, 3), "text": text}]
+    return []
+
+
+class SegmentedTranscriber:
+    """Wraps a service exposing transcribe(path) -> {"text", ...}"""
+
+    def __init__(self, service, preprocessor: AudioPreprocessor, segment_seconds: float = 600, max_workers: int = 4):
+        self.service = service
+        self.preprocessor = preprocessor
+        self.segment_seconds = segment_seconds
+        self.max_workers = max_workers
+
+    def transcribe(self, audio_path: str) -> Dict[str, Any]:
+        """
+        Transcribe audio_path, splitting it first if it is long.
+
+        Returns:
+            {"text": str, "segments": [{"start", "end", "text"}, ...],
+            "words": [{"start", "end", "text"}, ...]} with times in seconds
+            from the start of audio_path
+        """
+        samples = self.preprocessor.decode(audio_path)
+        cuts = self.preprocessor.split_points(samples, self.segment_seconds)
+        if not cuts:
+            return self.service.transcribe(audio_path)
+
+        rate = self.preprocessor.sample_rate
+        bounds = list(zip([0] + cuts, cuts + [samples.size]))
+
+        work_dir = tempfile.mkdtemp(prefix="meeto-seg-", dir=settings.UPLOAD_DIR)
+        try:
+            paths = []
+            for i, (start, end) in enumerate(bounds):
+                path = os.path.join(work_dir, f"segment_{i:04d}.ogg")
+                self.preprocessor.encode(samples[start:end], path)
+                paths.append(path)
+
+            print(f"Transcribing {len(paths)} segments of ~{self.segment_seconds:.0f}s with {self.max_workers} worker(s)")
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="transcribe") as pool:
+                results = list(pool.map(self.service.transcribe, paths))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        return self._stitch(results, [(start / rate, end / rate) for start, end in bounds])
+
+    def _stitch(self, results: List[Dict[str, Any]], bounds: List[tuple]) -> Dict[str, Any]:
+        texts = []
+        segments = []
+        words = []
+        for result, (offset, end) in zip(results, bounds):
+            text = (result.get("text") or "").strip()
+            if text:
+                texts.append(text)
+
+            piece_words = offset_words(result.get("words"), offset)
+            words.extend(piece_words)
+
+            segments.extend(piece_segments(result, offset, end, piece_words))
+
+        return {"text": " ".join(texts), "segments": segments, "words": words}
+
+
+def build_segmented_transcriber(service) -> Optional[SegmentedTranscriber]:
+    """Return a SegmentedTranscriber for service, or None if not enabled/available"""
+    if not (settings.SEGMENTED_TRANSCRIPTION and service and audio_preprocessor):
+        return None
+    return SegmentedTranscriber(
+        service,
+        audio_preprocessor,
+        segment_seconds=settings.TRANSCRIPTION_SEGMENT_SECONDS,
+        max_workers=settings.TRANSCRIPTION_CONCURRENCY
+    )
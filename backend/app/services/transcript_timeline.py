@@ -0,0 +1,267 @@
+"""
+Compact transcript timings
+Segment and word timings are kept as parallel uint32 arrays (milliseconds and
+character offsets into one text buffer) and serialized to a single compressed
+blob, instead of lists of dicts. A 3-hour meeting's ~30k words take a few
+hundred KB before compression.
+"""
+import re
+import struct
+import zlib
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Stored for segments/words whose time is unknown (e.g. a transcript without timings)
+NO_TIME = 0xFFFFFFFF
+
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<BII")  # version, segment count, word count
+
+# Grouping words into segments when a service only returns words
+MAX_SEGMENT_WORDS = 40
+MAX_WORD_GAP = 1.5  # seconds of silence that end a segment
+_SENTENCE_END = re.compile(r"[.!?]['\")\]]*$")
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+
+def _field(item: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a dict or an SDK object"""
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+def _to_ms(seconds: Optional[float]) -> int:
+    if seconds is None:
+        return NO_TIME
+    return max(0, min(NO_TIME - 1, int(round(float(seconds) * 1000))))
+
+
+def _from_ms(ms: int) -> Optional[float]:
+    return None if ms == NO_TIME else ms / 1000.0
+
+
+def group_words(words: List[Tuple[Optional[float], Optional[float], str]]) -> List[Tuple[Optional[float], Optional[float], str]]:
+    """
+    Group (start, end, text) words into sentence-like segments: a segment
+    ends at sentence punctuation, a pause over MAX_WORD_GAP or after
+    MAX_SEGMENT_WORDS words.
+    """
+    segments = []
+    current: List[Tuple[Optional[float], Optional[float], str]] = []
+    for word in words:
+        if current:
+            prev_end, start = current[-1][1], word[0]
+            long_gap = prev_end is not None and start is not None and start - prev_end > MAX_WORD_GAP
+            if long_gap or len(current) >= MAX_SEGMENT_WORDS:
+                segments.append((current[0][0], current[-1][1], " ".join(w[2] for w in current)))
+                current = []
+        current.append(word)
+        if _SENTENCE_END.search(word[2]):
+            segments.append((current[0][0], current[-1][1], " ".join(w[2] for w in current)))
+            current = []
+    if current:
+        segments.append((current[0][0], current[-1][1], " ".join(w[2] for w in current)))
+    return segments
+
+
+class TranscriptTimeline:
+    """Segments (and optionally words) of a transcript with their timings"""
+
+    def __init__(self):
+        self.seg_start = array("I")
+        self.seg_end = array("I")
+        self.seg_text_end = array("I")  # end offset of each segment in self.text
+        self.word_start = array("I")
+        self.word_end = array("I")
+        self.word_segment = array("I")  # index of the segment each word belongs to
+        self.word_text_end = array("I")  # end offset of each word in self.words_text
+        self.text = ""
+        self.words_text = ""
+
+    def __len__(self) -> int:
+        return len(self.seg_start)
+
+    @property
+    def has_timings(self) -> bool:
+        # array.count runs in C; untimed transcripts have NO_TIME everywhere
+        return self.seg_start.count(NO_TIME) < len(self.seg_start)
+
+    # --- building ---
+
+    @classmethod
+    def from_result(
+        cls,
+        result: Dict[str, Any],
+        time_map: Optional[Callable[[float], float]] = None
+    ) -> "TranscriptTimeline":
+        """
+        Build from a transcription result {"text", "segments"?, "words"?}.
+
+        Segments and words are dicts or SDK objects with start/end in seconds
+        and text (words may use "word" instead of "text"). time_map converts
+        times to the original recording, e.g. PreprocessResult.to_original_time
+        after silence trimming. Without segments, words are grouped into
+        sentences; without either, the text is split into sentences with no
+        timings.
+        """
+        mapper = time_map or (lambda t: t)
+
+        def timed(items: Iterable[Any]) -> List[Tuple[Optional[float], Optional[float], str]]:
+            out = []
+            for item in items or []:
+                text = (_field(item, "text") or _field(item, "word") or "").strip()
+                if not text:
+                    continue
+                start, end = _field(item, "start"), _field(item, "end")
+                out.append((
+                    mapper(float(start)) if start is not None else None,
+                    mapper(float(end)) if end is not None else None,
+                    text
+                ))
+            return out
+
+        segments = timed(result.get("segments"))
+        words = timed(result.get("words"))
+        if not segments:
+            segments = group_words(words) if words else [
+                (None, None, sentence) for sentence in _SENTENCE_SPLIT.split((result.get("text") or "").strip()) if sentence
+            ]
+
+        timeline = cls()
+        timeline._set_segments(segments)
+        timeline._set_words(words)
+        return timeline
+
+    @classmethod
+    def from_text(cls, text: Optional[str]) -> "TranscriptTimeline":
+        """Untimed timeline for a transcript stored before timings were kept"""
+        return cls.from_result({"text": text or ""})
+
+    def _set_segments(self, segments: List[Tuple[Optional[float], Optional[float], str]]) -> None:
+        parts = []
+        offset = 0
+        for start, end, text in segments:
+            self.seg_start.append(_to_ms(start))
+            self.seg_end.append(_to_ms(end))
+            parts.append(text)
+            offset += len(text)
+            self.seg_text_end.append(offset)
+        self.text = "".join(parts)
+
+    def _set_words(self, words: List[Tuple[Optional[float], Optional[float], str]]) -> None:
+        parts = []
+        offset = 0
+        segment = 0
+        for start, end, text in words:
+            start_ms = _to_ms(start)
+            # Words arrive in time order; advance to the segment containing this word
+            while (
+                segment + 1 < len(self.seg_start)
+                and start_ms != NO_TIME
+                and self.seg_start[segment + 1] != NO_TIME
+                and start_ms >= self.seg_start[segment + 1]
+            ):
+                segment += 1
+            self.word_start.append(start_ms)
+            self.word_end.append(_to_ms(end))
+            self.word_segment.append(segment)
+            parts.append(text)
+            offset += len(text)
+            self.word_text_end.append(offset)
+        self.words_text = "".join(parts)
+
+    # --- reading ---
+
+    def segment_text(self, index: int) -> str:
+        start = self.seg_text_end[index - 1] if index else 0
+        return self.text[start:self.seg_text_end[index]]
+
+    def page(self, offset: int = 0, limit: int = 100, include_words: bool = False) -> List[Dict[str, Any]]:
+        """Segments offset..offset+limit as dicts, with their words if requested"""
+        end = min(len(self), offset + limit)
+        segments = [
+            {
+                "index": i,
+                "start": _from_ms(self.seg_start[i]),
+                "end": _from_ms(self.seg_end[i]),
+                "text": self.segment_text(i)
+            }
+            for i in range(offset, end)
+        ]
+
+        if include_words and segments:
+            by_segment: Dict[int, List[Dict[str, Any]]] = {s["index"]: [] for s in segments}
+            # word_segment is non-decreasing, so the page's words are one contiguous run
+            first = self._first_word_of(offset)
+            for w in range(first, len(self.word_segment)):
+                segment = self.word_segment[w]
+                if segment >= end:
+                    break
+                text_start = self.word_text_end[w - 1] if w else 0
+                by_segment[segment].append({
+                    "start": _from_ms(self.word_start[w]),
+                    "end": _from_ms(self.word_end[w]),
+                    "text": self.words_text[text_start:self.word_text_end[w]]
+                })
+            for s in segments:
+                s["words"] = by_segment[s["index"]]
+
+        return segments
+
+    def _first_word_of(self, segment: int) -> int:
+        """Binary search over word_segment"""
+        lo, hi = 0, len(self.word_segment)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.word_segment[mid] < segment:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    # --- serialization ---
+
+    def to_bytes(self) -> bytes:
+        arrays = [self.seg_start, self.seg_end, self.seg_text_end,
+                  self.word_start, self.word_end, self.word_segment, self.word_text_end]
+        body = b"".join(a.tobytes() for a in arrays)
+        text = self.text.encode("utf-8")
+        words_text = self.words_text.encode("utf-8")
+        raw = (
+            _HEADER.pack(FORMAT_VERSION, len(self.seg_start), len(self.word_start))
+            + struct.pack("<II", len(text), len(words_text))
+            + body + text + words_text
+        )
+        return zlib.compress(raw, 6)
+
+    @classmethod
+    def from_bytes(cls, blob: bytes, include_words: bool = True) -> "TranscriptTimeline":
+        """
+        Deserialize to_bytes() output. With include_words=False the word
+        timings are skipped, for callers that only read segments.
+        """
+        raw = zlib.decompress(blob)
+        version, n_seg, n_words = _HEADER.unpack_from(raw, 0)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported transcript timeline format {version}")
+        pos = _HEADER.size
+        text_len, words_text_len = struct.unpack_from("<II", raw, pos)
+        pos += 8
+
+        timeline = cls()
+        for name, count in (
+            ("seg_start", n_seg), ("seg_end", n_seg), ("seg_text_end", n_seg),
+            ("word_start", n_words), ("word_end", n_words), ("word_segment", n_words), ("word_text_end", n_words)
+        ):
+            values = array("I")
+            if include_words or name.startswith("seg_"):
+                values.frombytes(raw[pos:pos + count * values.itemsize])
+            pos += count * values.itemsize
+            setattr(timeline, name, values)
+
+        timeline.text = raw[pos:pos + text_len].decode("utf-8")
+        pos += text_len
+        if include_words:
+            timeline.words_text = raw[pos:pos + words_text_len].decode("utf-8")
+        return timeline
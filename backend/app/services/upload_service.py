@@ -0,0 +1,244 @@
+"""
+Upload handling: streamed single-request saves and resumable chunked sessions
+Session chunks are appended to disk as they arrive; the session row records the last
+acknowledged offset so clients can resume after a failed request or restart.
+"""
+import hashlib
+import os
+import uuid
+from datetime import datetime, timedelta
+from typing import BinaryIO, List, Optional, Tuple
+
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import Meeting, UploadSession
+
+
+# Bytes read/written per step when streaming an upload to disk
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds settings.MAX_UPLOAD_SIZE"""
+
+
+class UploadConflictError(Exception):
+    """Raised when a chunk does not match the session's expected position"""
+
+    def __init__(self, message: str, session: UploadSession):
+        super().__init__(message)
+        self.session = session
+
+
+def check_audio_format(filename: Optional[str], default_ext: str = ".webm") -> str:
+    """
+    Return the lower-cased extension of filename, or default_ext if it has none.
+
+    Raises ValueError if the extension is not in settings.ALLOWED_AUDIO_FORMATS.
+    """
+    ext = os.path.splitext(filename or "")[1].lower() or default_ext
+    if ext not in settings.ALLOWED_AUDIO_FORMATS:
+        raise ValueError(f"Unsupported audio format '{ext}'. Allowed: {', '.join(settings.ALLOWED_AUDIO_FORMATS)}")
+    return ext
+
+
+def _write_and_hash(f: BinaryIO, hasher, data: bytes) -> None:
+    hasher.update(data)
+    f.write(data)
+
+
+async def save_upload(upload: UploadFile, dest_path: str, max_size: Optional[int] = None) -> Tuple[int, str]:
+    """
+    Stream an UploadFile to dest_path without blocking the event loop.
+
+    Reads and writes in UPLOAD_BUFFER_SIZE steps, hashing in the same pass.
+    The partial file is removed if the upload crosses max_size.
+
+    Returns:
+        (size in bytes, SHA-256 hex digest)
+    """
+    max_size = max_size if max_size is not None else settings.MAX_UPLOAD_SIZE
+    hasher = hashlib.sha256()
+    size = 0
+
+    f = await run_in_threadpool(open, dest_path, "wb")
+    try:
+        while True:
+            data = await upload.read(UPLOAD_BUFFER_SIZE)
+            if not data:
+                break
+            size += len(data)
+            if size > max_size:
+                raise UploadTooLargeError(f"Upload exceeds maximum size of {max_size} bytes")
+            await run_in_threadpool(_write_and_hash, f, hasher, data)
+    except BaseException:
+        await run_in_threadpool(f.close)
+        await run_in_threadpool(_remove_quietly, dest_path)
+        raise
+
+    await run_in_threadpool(f.close)
+    return size, hasher.hexdigest()
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 hex digest of a file, read in UPLOAD_BUFFER_SIZE steps. Blocking IO."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for data in iter(lambda: f.read(UPLOAD_BUFFER_SIZE), b""):
+            hasher.update(data)
+    return hasher.hexdigest()
+
+
+def store_by_hash(temp_path: str, audio_hash: str, ext: str) -> str:
+    """
+    Move a freshly written upload to its content-addressed path in UPLOAD_DIR.
+
+    If audio with the same hash is already stored the new copy is discarded.
+    Returns the content-addressed path. Blocking IO.
+    """
+    final_path = os.path.join(settings.UPLOAD_DIR, f"{audio_hash}{ext}")
+    if os.path.exists(final_path):
+        _remove_quietly(temp_path)
+    else:
+        os.replace(temp_path, final_path)
+    return final_path
+
+
+def find_meeting_by_hash(db: Session, audio_hash: str, exclude_id: Optional[int] = None) -> Optional[Meeting]:
+    """
+    Find an earlier meeting for the same audio that can be reused.
+
+    Failed meetings are ignored so a re-upload gets a fresh attempt.
+    """
+    query = db.query(Meeting).filter(Meeting.audio_hash == audio_hash, Meeting.status != "ERROR")
+    if exclude_id is not None:
+        query = query.filter(Meeting.id != exclude_id)
+    return query.order_by(Meeting.id).first()
+
+
+def create_session(db: Session) -> UploadSession:
+    """Open a new upload session with an empty part file"""
+    session_id = uuid.uuid4().hex
+    file_path = os.path.join(settings.UPLOAD_DIR, f"{session_id}.webm.part")
+    open(file_path, "wb").close()
+
+    upload = UploadSession(id=session_id, file_path=file_path, status="OPEN")
+    db.add(upload)
+    db.commit()
+    db.refresh(upload)
+    return upload
+
+
+def get_session(db: Session, session_id: str) -> Optional[UploadSession]:
+    return db.query(UploadSession).filter(UploadSession.id == session_id).first()
+
+
+def append_chunk(db: Session, upload: UploadSession, index: int, data: bytes) -> UploadSession:
+    """
+    Append chunk `index` to the session file.
+
+    Chunks must arrive in order. A chunk below next_chunk is a retry of one
+    already acknowledged and is ignored; a chunk above it is rejected so the
+    client can resend from next_chunk.
+
+    Blocking file IO - call from a threadpool in async endpoints.
+    """
+    if upload.status != "OPEN":
+        raise UploadConflictError("Upload session is already finalized", upload)
+
+    if index < upload.next_chunk:
+        return upload
+
+    if index > upload.next_chunk:
+        raise UploadConflictError(f"Expected chunk {upload.next_chunk}, got {index}", upload)
+
+    if upload.bytes_received + len(data) > settings.MAX_UPLOAD_SIZE:
+        raise UploadTooLargeError(f"Upload exceeds maximum size of {settings.MAX_UPLOAD_SIZE} bytes")
+
+    with open(upload.file_path, "r+b") as f:
+        # Drop any bytes written after the last acknowledged offset (e.g. a
+        # write that landed before a crash but was never committed)
+        f.truncate(upload.bytes_received)
+        f.seek(upload.bytes_received)
+        f.write(data)
+
+    upload.next_chunk = index + 1
+    upload.bytes_received += len(data)
+    upload.updated_at = datetime.utcnow()
+    db.commit()
+    return upload
+
+
+def claim_session(db: Session, upload: UploadSession, status: str) -> bool:
+    """
+    Move an OPEN session to status with a conditional UPDATE, so of several
+    concurrent callers exactly one succeeds. Commits and refreshes upload.
+    """
+    claimed = (
+        db.query(UploadSession)
+        .filter(UploadSession.id == upload.id, UploadSession.status == "OPEN")
+        .update({"status": status, "updated_at": datetime.utcnow()}, synchronize_session=False)
+    )
+    db.commit()
+    db.refresh(upload)
+    return claimed == 1
+
+
+def finalize_session(db: Session, upload: UploadSession) -> Tuple[str, str]:
+    """
+    Close the session and move the part file to its content-addressed path.
+
+    The session is claimed first, so a concurrent finalize (or expiry) of the
+    same session raises UploadConflictError instead of racing on the file.
+    If moving the file fails the session is reopened.
+
+    Returns (final audio path, SHA-256 hex digest). Blocking file IO.
+    """
+    if not claim_session(db, upload, "FINALIZING"):
+        raise UploadConflictError(f"Upload session is {upload.status.lower()}", upload)
+
+    try:
+        with open(upload.file_path, "r+b") as f:
+            f.truncate(upload.bytes_received)
+        audio_hash = hash_file(upload.file_path)
+        final_path = store_by_hash(upload.file_path, audio_hash, ".webm")
+    except Exception:
+        upload.status = "OPEN"
+        db.commit()
+        raise
+
+    upload.file_path = final_path
+    upload.status = "FINALIZED"
+    upload.updated_at = datetime.utcnow()
+    return final_path, audio_hash
+
+
+def expire_session(db: Session, upload: UploadSession) -> bool:
+    """
+    Close an abandoned session and delete its part file. Returns False if
+    the session was finalized or expired concurrently.
+    """
+    if not claim_session(db, upload, "EXPIRED"):
+        return False
+    if os.path.exists(upload.file_path):
+        os.remove(upload.file_path)
+    return True
+
+
+def stale_sessions(db: Session, idle_seconds: float, live: bool) -> List[UploadSession]:
+    """OPEN sessions without a chunk for idle_seconds; live=True for /ws/live recordings"""
+    cutoff = datetime.utcnow() - timedelta(seconds=idle_seconds)
+    query = db.query(UploadSession).filter(UploadSession.status == "OPEN", UploadSession.updated_at < cutoff)
+    if live:
+        return query.filter(UploadSession.meeting_id.isnot(None)).all()
+    return query.filter(UploadSession.meeting_id.is_(None)).all()
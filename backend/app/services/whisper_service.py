@@ -43,7 +43,8 @@ class WhisperService:
                 transcript = self.client.audio.transcriptions.create(
                     model="whisper-1",
                     file=audio_file,
-                    response_format="verbose_json"
+                    response_format="verbose_json",
+                    timestamp_granularities=["segment", "word"]
                 )
             
             # Extract segments if available
@@ -52,11 +53,15 @@ class WhisperService:
                 segments = transcript.segments
             elif isinstance(transcript, dict) and 'segments' in transcript:
                 segments = transcript['segments']
+
+            # Word timings (only returned when requested via timestamp_granularities)
+            words = getattr(transcript, 'words', None) or []
             
             return {
                 "text": transcript.text,
                 "language": getattr(transcript, 'language', 'unknown'),
                 "segments": segments,
+                "words": words,
                 "full_result": transcript.model_dump() if hasattr(transcript, 'model_dump') else str(transcript)
             }
         except Exception as e:
@@ -1,7 +1,23 @@
 // offscreen.js
 
+const API_BASE = 'http://localhost:8000';
+const WS_BASE = 'ws://localhost:8000';
+const MAX_CHUNK_RETRIES = 5;
+const MAX_RETRY_DELAY_MS = 30000;
+
 let mediaRecorder;
-let recordedChunks = [];
+let recordedChunks = []; // Only used if a chunked upload session can't be opened
+
+// Chunked upload state: chunks are sent as they are recorded and dropped once acknowledged
+let uploadSessionId = null;
+let pendingChunks = []; // [{ index, blob }] not yet acknowledged by the server
+let nextChunkIndex = 0;
+let uploading = false;
+let stopRequested = false;
+
+// Live mode: chunks go over a WebSocket and are transcribed while recording.
+// If the socket drops, the same session continues over the HTTP chunk endpoints.
+let liveSocket = null;
 
 chrome.runtime.onMessage.addListener(async (message) => {
     if (message.target !== "offscreen") return;
@@ -30,15 +46,38 @@ async function startRecording(streamId) {
         const source = audioCtx.createMediaStreamSource(stream);
         source.connect(audioCtx.destination);
 
+        resetUploadState();
+        if (!(await openLiveSocket())) {
+            await openUploadSession();
+        }
+
         mediaRecorder = new MediaRecorder(stream, { mimeType: 'audio/webm' });
 
         mediaRecorder.ondataavailable = (event) => {
             if (event.data.size > 0) {
-                recordedChunks.push(event.data);
+                if (uploadSessionId) {
+                    pendingChunks.push({ index: nextChunkIndex++, blob: event.data });
+                    if (liveSocket) {
+                        liveSocket.send(event.data);
+                    } else {
+                        drainChunks();
+                    }
+                } else {
+                    recordedChunks.push(event.data);
+                }
             }
         };
 
-        mediaRecorder.onstop = uploadRecording;
+        mediaRecorder.onstop = () => {
+            stopRequested = true;
+            if (liveSocket) {
+                liveSocket.send(JSON.stringify({ type: 'stop' }));
+            } else if (uploadSessionId) {
+                drainChunks();
+            } else {
+                uploadRecording();
+            }
+        };
 
         mediaRecorder.start(1000); // Collect 1s chunks
         console.log("Recording started");
@@ -55,6 +94,153 @@ function stopRecording() {
     }
 }
 
+function resetUploadState() {
+    uploadSessionId = null;
+    pendingChunks = [];
+    nextChunkIndex = 0;
+    stopRequested = false;
+    liveSocket = null;
+}
+
+// Resolves true once the server has opened a live session
+function openLiveSocket() {
+    return new Promise((resolve) => {
+        let ready = false;
+        let socket;
+        try {
+            socket = new WebSocket(`${WS_BASE}/ws/live`);
+        } catch (err) {
+            resolve(false);
+            return;
+        }
+        socket.binaryType = 'arraybuffer';
+
+        socket.onmessage = (event) => {
+            const msg = JSON.parse(event.data);
+            if (msg.type === 'ready') {
+                ready = true;
+                liveSocket = socket;
+                uploadSessionId = msg.session_id;
+                resolve(true);
+            } else if (msg.type === 'ack') {
+                pendingChunks = pendingChunks.filter(c => c.index >= msg.next_chunk);
+            } else if (msg.type === 'transcript') {
+                console.log("Live transcript:", msg.text);
+            } else if (msg.type === 'done') {
+                console.log("Upload successful");
+                liveSocket = null;
+                uploadSessionId = null;
+                socket.close();
+            } else if (msg.type === 'error') {
+                console.error("Live session error:", msg.detail);
+            }
+        };
+
+        socket.onclose = () => {
+            if (!ready) {
+                resolve(false);
+                return;
+            }
+            if (liveSocket === socket) {
+                // Dropped mid-recording: resend anything unacknowledged over HTTP
+                console.warn("Live connection lost, continuing with chunked upload");
+                liveSocket = null;
+                drainChunks();
+            }
+        };
+
+        socket.onerror = () => {
+            if (!ready) resolve(false);
+        };
+    });
+}
+
+async function openUploadSession() {
+    try {
+        const response = await fetch(`${API_BASE}/api/upload-sessions`, { method: 'POST' });
+        if (response.ok) {
+            const data = await response.json();
+            uploadSessionId = data.session_id;
+        }
+    } catch (err) {
+        console.warn("Could not open upload session, falling back to single upload", err);
+    }
+}
+
+function sleep(ms) {
+    return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+// Send pending chunks in order, one at a time. Safe to call repeatedly.
+async function drainChunks() {
+    if (uploading) return;
+    uploading = true;
+
+    try {
+        let failures = 0;
+        while (pendingChunks.length > 0) {
+            const { index, blob } = pendingChunks[0];
+            try {
+                const response = await fetch(`${API_BASE}/api/upload-sessions/${uploadSessionId}/chunks/${index}`, {
+                    method: 'PUT',
+                    headers: { 'Content-Type': 'application/octet-stream' },
+                    body: blob
+                });
+
+                if (response.ok || response.status === 409) {
+                    // 409 carries the server's position; drop everything it already has
+                    const state = await response.json();
+                    pendingChunks = pendingChunks.filter(c => c.index >= state.next_chunk);
+                    failures = 0;
+                    continue;
+                }
+                throw new Error(`HTTP ${response.status}`);
+            } catch (err) {
+                failures += 1;
+                if (failures > MAX_CHUNK_RETRIES && !stopRequested) {
+                    console.error("Chunk upload failed, will retry with the next chunk", err);
+                    return;
+                }
+                // After stop no further chunk will trigger a retry, so keep trying
+                // until the server is back rather than leaving the session unfinalized
+                await sleep(Math.min(500 * 2 ** failures, MAX_RETRY_DELAY_MS));
+            }
+        }
+
+        if (stopRequested) {
+            await finalizeUpload();
+        }
+    } finally {
+        uploading = false;
+    }
+}
+
+// Retried on network and server errors, like the chunks before it
+async function finalizeUpload() {
+    for (let failures = 1; ; failures++) {
+        try {
+            const response = await fetch(`${API_BASE}/api/upload-sessions/${uploadSessionId}/finalize`, {
+                method: 'POST'
+            });
+
+            if (response.ok) {
+                console.log("Upload successful");
+                uploadSessionId = null;
+                return;
+            }
+            if (response.status < 500) {
+                console.error("Upload finalize failed", response.status);
+                return;
+            }
+            console.error("Upload finalize failed, retrying", response.status);
+        } catch (err) {
+            console.error("Upload finalize error, retrying", err);
+        }
+        await sleep(Math.min(500 * 2 ** failures, MAX_RETRY_DELAY_MS));
+    }
+}
+
+// Legacy single-request upload, used when no upload session is available
 async function uploadRecording() {
     const blob = new Blob(recordedChunks, { type: 'audio/webm' });
     recordedChunks = [];
@@ -63,7 +249,7 @@ async function uploadRecording() {
     formData.append('file', blob, 'meeting_audio.webm');
 
     try {
-        const response = await fetch('http://localhost:8000/api/upload-stream', {
+        const response = await fetch(`${API_BASE}/api/upload-stream`, {
             method: 'POST',
             body: formData
         });